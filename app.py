@@ -1,21 +1,31 @@
 import os
+import queue
+import re
 import sqlite3
-from datetime import datetime, date, timezone
+import threading
+import time
+from datetime import datetime, date, timedelta, timezone
 import calendar
+import hashlib
+import hmac
+import json
 import urllib.parse
 import uuid
 import traceback
+from functools import lru_cache
 
 from zoneinfo import ZoneInfo
 
 import requests
 import gspread
+from requests.adapters import HTTPAdapter
 
 from google.oauth2.service_account import Credentials
 from google.auth.transport.requests import Request as GoogleAuthRequest
 from flask import (
     Flask,
     g,
+    has_request_context,
     render_template,
     request,
     redirect,
@@ -63,16 +73,64 @@ def utc_now():
 def utc_now_iso():
     return utc_now().isoformat()
 
+
+# (name, number) for the month pickers and per-month loops; built once, shared read-only.
+MONTH_NAMES = (
+    ("January", 1), ("February", 2), ("March", 3), ("April", 4),
+    ("May", 5), ("June", 6), ("July", 7), ("August", 8),
+    ("September", 9), ("October", 10), ("November", 11), ("December", 12),
+)
+
 # ========================
 # DB helpers
 # ========================
 
 
+# Idle connections handed back by close_connection(); reused instead of reconnecting per request.
+# LIFO: the most recently returned connection has the warmest page cache.
+DB_POOL_SIZE = 8
+_DB_POOL = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+
+# journal_mode=WAL is stored in the database file, so it only needs setting once per file.
+_WAL_DATABASES = set()
+
+
+def _open_db_connection():
+    # Roomier statement cache: sync, analytics and page queries together exceed the default 128.
+    # timeout=30 is the busy_timeout: wait for a sync's write lock instead of failing.
+    db = sqlite3.connect(DATABASE, timeout=30, check_same_thread=False, cached_statements=512)
+    db.row_factory = sqlite3.Row
+    # WAL lets page reads run alongside a sync's write transaction, and
+    # synchronous=NORMAL fsyncs per checkpoint instead of per commit: a power cut can
+    # roll back the last few commits but cannot corrupt the file.
+    if DATABASE not in _WAL_DATABASES:
+        db.execute("PRAGMA journal_mode = WAL")
+        _WAL_DATABASES.add(DATABASE)
+    db.execute("PRAGMA synchronous = NORMAL")
+    db.execute("PRAGMA temp_store = MEMORY")
+    db.execute("PRAGMA cache_size = -65536")
+    # Map up to 256 MB of the file: reads come from the OS page cache without read() copies.
+    db.execute("PRAGMA mmap_size = 268435456")
+    return DATABASE, db
+
+
+def _take_db_connection():
+    while True:
+        try:
+            path, db = _DB_POOL.get_nowait()
+        except queue.Empty:
+            return _open_db_connection()
+        if path == DATABASE:
+            return path, db
+        # DATABASE was repointed after this connection was pooled.
+        db.close()
+
+
 def get_db():
     db = getattr(g, "_database", None)
     if db is None:
-        db = g._database = sqlite3.connect(DATABASE, check_same_thread=False)
-        db.row_factory = sqlite3.Row
+        g._database_path, db = _take_db_connection()
+        g._database = db
     return db
 def migrate_monthly_reports_scope_to_pastor():
     """One-time SQLite migration.
@@ -87,8 +145,7 @@ def migrate_monthly_reports_scope_to_pastor():
     db = get_db()
     cur = db.cursor()
 
-    cols = [r["name"] for r in cur.execute("PRAGMA table_info(monthly_reports)").fetchall()]
-    if "pastor_username" in cols:
+    if _has_column(cur, "monthly_reports", "pastor_username"):
         return
 
     cur.execute("ALTER TABLE monthly_reports RENAME TO monthly_reports_old")
@@ -120,6 +177,73 @@ def migrate_monthly_reports_scope_to_pastor():
     cur.execute("DROP TABLE monthly_reports_old")
     db.commit()
 
+# Secondary (non-unique) indexes on the sheet caches. Sync drops them before a reload
+# and rebuilds them once afterwards instead of updating every B-tree per inserted row.
+# UNIQUE indexes stay in place: INSERT OR REPLACE relies on them.
+SHEET_CACHE_INDEXES = {
+    "sheet_accounts_cache": {
+        # Expression index matching the TRIM(age) = TRIM(?) area lookups.
+        "idx_accounts_trim_age": "sheet_accounts_cache(TRIM(age))",
+        # TRIM(username) lookups (account edit/delete, login scope) and the church -> area lookup.
+        "idx_accounts_trim_username": "sheet_accounts_cache(TRIM(username))",
+        "idx_accounts_trim_sex": "sheet_accounts_cache(TRIM(sex))",
+        "idx_accounts_trim_church_address": "sheet_accounts_cache(TRIM(church_address))",
+    },
+    "sheet_report_cache": {
+        "idx_report_ym_addr": "sheet_report_cache(year, month, address)",
+        "idx_report_ym_church": "sheet_report_cache(year, month, church)",
+        "idx_report_ym": "sheet_report_cache(year, month)",
+        # Expression indexes matching the TRIM(...) = TRIM(?) lookups used throughout.
+        "idx_report_ym_trim_addr": "sheet_report_cache(year, month, TRIM(address))",
+        "idx_report_ym_trim_church": "sheet_report_cache(year, month, TRIM(church))",
+        # Third leg of the pastor month sync's address/church/pastor OR, so it can use the index union.
+        "idx_report_ym_trim_pastor": "sheet_report_cache(year, month, TRIM(pastor))",
+        # Whole-year per-church lookups (church status year stats) have no month to bind.
+        "idx_report_y_trim_addr": "sheet_report_cache(year, TRIM(address))",
+        "idx_report_y_trim_church": "sheet_report_cache(year, TRIM(church))",
+        # Delta sync deletes changed/removed rows by sheet_row.
+        "idx_report_sheet_row": "sheet_report_cache(sheet_row)",
+    },
+    "sheet_prayer_request_cache": {
+        # Matches the TRIM(submitted_by) = TRIM(?) per-user lookups (any cache writer, no extra column),
+        # already in their request_date DESC, sheet_row DESC display order.
+        "idx_prayer_trim_submitted_by_date": (
+            "sheet_prayer_request_cache(TRIM(submitted_by), request_date DESC, sheet_row DESC)"
+        ),
+        "idx_prayer_status": "sheet_prayer_request_cache(status)",
+        # Partial index: only pending rows, already in the AO queue's display order.
+        "idx_prayer_pending": (
+            "sheet_prayer_request_cache(request_date DESC, sheet_row DESC) "
+            "WHERE TRIM(status) = 'Pending'"
+        ),
+    },
+    "sheet_district_schedule_cache": {
+        "idx_district_schedule_start": "sheet_district_schedule_cache(activity_date_start)",
+    },
+    "sheet_chain_prayer_schedule_cache": {
+        "idx_chain_prayer_date": "sheet_chain_prayer_schedule_cache(prayer_date)",
+    },
+    "sheet_announcement_cache": {
+        "idx_announcement_scope": "sheet_announcement_cache(area, sub_area)",
+    },
+}
+
+
+def _has_column(cur, table: str, column: str) -> bool:
+    # Stops at the first match instead of materializing the whole column list.
+    return any(row[1] == column for row in cur.execute(f"PRAGMA table_info({table})"))
+
+
+def _drop_cache_indexes(cur, table: str):
+    for name in SHEET_CACHE_INDEXES.get(table, {}):
+        cur.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def _create_cache_indexes(cur, table: str):
+    for name, target in SHEET_CACHE_INDEXES.get(table, {}).items():
+        cur.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+
+
 def init_db():
     db = get_db()
     cursor = db.cursor()
@@ -156,11 +280,35 @@ def init_db():
             offering REAL,
             mission REAL,
             tithes_personal REAL,
+            y INTEGER,
+            m INTEGER,
+            d INTEGER,
             FOREIGN KEY (monthly_report_id) REFERENCES monthly_reports(id),
             UNIQUE(monthly_report_id, date)
         )
         """
     )
+    if not _has_column(cursor, "sunday_reports", "y"):
+        # Split date parts so exports don't re-parse the ISO date string per row.
+        try:
+            cursor.execute("ALTER TABLE sunday_reports ADD COLUMN y INTEGER")
+            cursor.execute("ALTER TABLE sunday_reports ADD COLUMN m INTEGER")
+            cursor.execute("ALTER TABLE sunday_reports ADD COLUMN d INTEGER")
+            cursor.execute(
+                """
+                UPDATE sunday_reports
+                SET y = CAST(substr(date, 1, 4) AS INTEGER),
+                    m = CAST(substr(date, 6, 2) AS INTEGER),
+                    d = CAST(substr(date, 9, 2) AS INTEGER)
+                """
+            )
+        except Exception:
+            pass
+    # Per-report lookups (and their ORDER BY date) already use the UNIQUE(monthly_report_id, date)
+    # autoindex; church_progress.monthly_report_id is UNIQUE too, so neither FK needs its own index.
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_sunday_mr_complete ON sunday_reports(monthly_report_id, is_complete)"
+    )
 
     cursor.execute(
         """
@@ -206,9 +354,7 @@ def init_db():
         )
         """
     )
-    cursor.execute("PRAGMA table_info(pastors)")
-    cols = [row[1] for row in cursor.fetchall()]
-    if "birthday" not in cols:
+    if not _has_column(cursor, "pastors", "birthday"):
         cursor.execute("ALTER TABLE pastors ADD COLUMN birthday TEXT")
 
     # ==========================
@@ -223,6 +369,18 @@ def init_db():
         """
     )
     cursor.execute("INSERT OR IGNORE INTO sync_state (id, last_sync) VALUES (1, NULL)")
+    if not _has_column(cursor, "sync_state", "report_status_col"):
+        try:
+            # 0-based index of the Report tab's status column, refreshed on every sync.
+            cursor.execute("ALTER TABLE sync_state ADD COLUMN report_status_col INTEGER")
+        except Exception:
+            pass
+    if not _has_column(cursor, "sync_state", "sheets_fetched_at"):
+        try:
+            # When this app's last full sync started downloading (see sync_from_sheets_if_needed).
+            cursor.execute("ALTER TABLE sync_state ADD COLUMN sheets_fetched_at TEXT")
+        except Exception:
+            pass
 
     cursor.execute(
         """
@@ -266,6 +424,19 @@ def init_db():
         "CREATE INDEX IF NOT EXISTS idx_submit_report_jobs_user_month ON submit_report_jobs(pastor_username, year, month, status)"
     )
 
+    # Background Sheets writes that ran out of retries (see _sheets_worker).
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS sheets_write_failures (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            created_at TEXT NOT NULL,
+            op TEXT NOT NULL,
+            payload TEXT,
+            error_message TEXT
+        )
+        """
+    )
+
     cursor.execute(
         """
         CREATE TABLE IF NOT EXISTS sheet_accounts_cache (
@@ -367,7 +538,8 @@ def init_db():
 
             amount_to_send REAL,
             status TEXT,
-            report_status TEXT
+            report_status TEXT,
+            row_hash BLOB
         )
         """
     )
@@ -387,9 +559,7 @@ def init_db():
         """
     )
 
-    cursor.execute("PRAGMA table_info(sheet_aopt_cache)")
-    _aopt_cols = [row[1] for row in cursor.fetchall()]
-    if "area_number" not in _aopt_cols:
+    if not _has_column(cursor, "sheet_aopt_cache", "area_number"):
         try:
             cursor.execute("ALTER TABLE sheet_aopt_cache ADD COLUMN area_number TEXT NOT NULL DEFAULT ''")
         except Exception:
@@ -399,9 +569,7 @@ def init_db():
     except Exception:
         pass
 
-    cursor.execute("PRAGMA table_info(sheet_aopt_cache)")
-    _aopt_cols2 = [row[1] for row in cursor.fetchall()]
-    if "sub_area" not in _aopt_cols2:
+    if not _has_column(cursor, "sheet_aopt_cache", "sub_area"):
         try:
             cursor.execute("ALTER TABLE sheet_aopt_cache ADD COLUMN sub_area TEXT NOT NULL DEFAULT ''")
         except Exception:
@@ -443,7 +611,6 @@ def init_db():
         )
         """
     )
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_announcement_scope ON sheet_announcement_cache(area, sub_area)")
 
     cursor.execute(
         """
@@ -523,17 +690,11 @@ def init_db():
         """
     )
 
-    cursor.execute("PRAGMA table_info(sheet_chain_prayer_schedule_cache)")
-    _cp_cols = [row[1] for row in cursor.fetchall()]
-    if "pastor_name" not in _cp_cols:
+    if not _has_column(cursor, "sheet_chain_prayer_schedule_cache", "pastor_name"):
         try:
             cursor.execute("ALTER TABLE sheet_chain_prayer_schedule_cache ADD COLUMN pastor_name TEXT")
         except Exception:
             pass
-
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_chain_prayer_date ON sheet_chain_prayer_schedule_cache(prayer_date)"
-    )
     cursor.execute("PRAGMA table_info(sheet_district_schedule_cache)")
     _ds_cols = [row[1] for row in cursor.fetchall()]
     if "joining" not in _ds_cols:
@@ -551,10 +712,6 @@ def init_db():
             cursor.execute("ALTER TABLE sheet_district_schedule_cache ADD COLUMN text TEXT")
         except Exception:
             pass
-
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_district_schedule_start ON sheet_district_schedule_cache(activity_date_start)"
-    )
     
     cursor.execute("PRAGMA table_info(sheet_report_cache)")
     _rep_cols = [row[1] for row in cursor.fetchall()]
@@ -563,23 +720,27 @@ def init_db():
             cursor.execute("ALTER TABLE sheet_report_cache ADD COLUMN report_status TEXT")
         except Exception:
             pass
+    if "row_hash" not in _rep_cols:
+        try:
+            cursor.execute("ALTER TABLE sheet_report_cache ADD COLUMN row_hash BLOB")
+        except Exception:
+            pass
 
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_report_ym_addr ON sheet_report_cache(year, month, address)"
-    )
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_report_ym_church ON sheet_report_cache(year, month, church)"
-    )
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_report_ym ON sheet_report_cache(year, month)")
+    # Superseded by idx_prayer_trim_submitted_by_date (the lookups compare TRIM(submitted_by)).
+    cursor.execute("DROP INDEX IF EXISTS idx_prayer_submitted_by")
+    cursor.execute("DROP INDEX IF EXISTS idx_prayer_trim_submitted_by")
 
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_prayer_submitted_by ON sheet_prayer_request_cache(submitted_by)"
-    )
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_prayer_status ON sheet_prayer_request_cache(status)"
-    )
+    for table in SHEET_CACHE_INDEXES:
+        _create_cache_indexes(cursor, table)
 
     migrate_monthly_reports_scope_to_pastor()
+    if not _has_column(cursor, "monthly_reports", "cache_digest"):
+        try:
+            # Digest of the Report cache rows last copied into the month's local rows
+            # (see sync_local_month_from_cache_for_pastor); cleared by every local edit.
+            cursor.execute("ALTER TABLE monthly_reports ADD COLUMN cache_digest BLOB")
+        except Exception:
+            pass
     db.commit()
 
 
@@ -604,47 +765,54 @@ def get_or_create_monthly_report(year: int, month: int, pastor_username: str):
     if row:
         return row
 
-    cursor.execute(
+    # Create (or pick up a row a concurrent request just created) in one statement.
+    row = cursor.execute(
         """
         INSERT INTO monthly_reports (year, month, pastor_username, submitted, approved)
         VALUES (?, ?, ?, 0, 0)
+        ON CONFLICT(year, month, pastor_username) DO UPDATE SET year = excluded.year
+        RETURNING *
         """,
         (year, month, pastor_username),
-    )
+    ).fetchone()
     db.commit()
-
-    cursor.execute(
-        "SELECT * FROM monthly_reports WHERE year = ? AND month = ? AND pastor_username = ?",
-        (year, month, pastor_username),
-    )
-    return cursor.fetchone()
+    return row
 
 
+@lru_cache(maxsize=64)
 def generate_sundays_for_month(year: int, month: int):
+    # Cached, so hand out a tuple nobody can mutate.
+    first = date(year, month, 1)
+    d = first + timedelta(days=(calendar.SUNDAY - first.weekday()) % 7)
     sundays = []
-    cal = calendar.Calendar(firstweekday=calendar.SUNDAY)
-    for week in cal.monthdatescalendar(year, month):
-        for d in week:
-            if d.month == month and d.weekday() == calendar.SUNDAY:
-                sundays.append(d)
-    return sundays
+    while d.month == month:
+        sundays.append(d)
+        d += timedelta(days=7)
+    return tuple(sundays)
 
 
 def ensure_sunday_reports(monthly_report_id: int, year: int, month: int):
     db = get_db()
     cursor = db.cursor()
     sundays = generate_sundays_for_month(year, month)
-    for d in sundays:
-        cursor.execute(
-            """
-            INSERT OR IGNORE INTO sunday_reports (monthly_report_id, date)
-            VALUES (?, ?)
-            """,
-            (monthly_report_id, d.isoformat()),
-        )
+    cursor.executemany(
+        """
+        INSERT OR IGNORE INTO sunday_reports (monthly_report_id, date, y, m, d)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        [(monthly_report_id, d.isoformat(), d.year, d.month, d.day) for d in sundays],
+    )
     db.commit()
 
 
+def sunday_sheet_date(row):
+    """M/D/YYYY activity_date for the Report sheet, from the stored y/m/d parts."""
+    if row["y"]:
+        return f"{row['m']}/{row['d']}/{row['y']}"
+    d = date.fromisoformat(row["date"])
+    return f"{d.month}/{d.day}/{d.year}"
+
+
 def get_sunday_reports(monthly_report_id: int):
     db = get_db()
     cursor = db.cursor()
@@ -678,7 +846,8 @@ def set_month_submitted(year: int, month: int, pastor_username: str):
 
     db = get_db()
     cursor = db.cursor()
-    now_str = utc_now_iso()
+    # Same ISO-8601 UTC shape as utc_now_iso(), without building a datetime.
+    now_str = time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
     cursor.execute(
         """
         UPDATE monthly_reports
@@ -723,20 +892,17 @@ def ensure_church_progress(monthly_report_id: int):
     if row:
         return row
 
-    cursor.execute(
+    row = cursor.execute(
         """
         INSERT INTO church_progress (monthly_report_id, is_complete)
         VALUES (?, 0)
+        ON CONFLICT(monthly_report_id) DO UPDATE SET monthly_report_id = excluded.monthly_report_id
+        RETURNING *
         """,
         (monthly_report_id,),
-    )
+    ).fetchone()
     db.commit()
-
-    cursor.execute(
-        "SELECT * FROM church_progress WHERE monthly_report_id = ?",
-        (monthly_report_id,),
-    )
-    return cursor.fetchone()
+    return row
 
 
 # ========================
@@ -775,25 +941,96 @@ def _prepare_report_print_via_apps_script(area_number: str, year: int, month: in
 
     return data
 
+# The authorized client is built once per process (see get_gs_client). The opened
+# spreadsheet is reused for 30 minutes: every client.open() is a Drive search round-trip.
+GS_HANDLE_TTL_SECONDS = 30 * 60
+_GS_CLIENT = None
+_GS_SPREADSHEET = None  # (expires_at, client, spreadsheet)
+_GS_WORKSHEETS = {}  # title -> (spreadsheet, worksheet)
+_GS_LOCK = threading.Lock()
+
+
 def get_gs_client():
-    creds = Credentials.from_service_account_file(
-        GOOGLE_SHEETS_CREDENTIALS_FILE,
-        scopes=GOOGLE_SHEETS_SCOPES,
-    )
-    return gspread.authorize(creds)
+    global _GS_CLIENT
+    with _GS_LOCK:
+        # Built once: the authorized session refreshes its access token itself when it expires,
+        # so later calls skip the key load, token exchange and TLS handshake.
+        if _GS_CLIENT is None:
+            creds = Credentials.from_service_account_file(
+                GOOGLE_SHEETS_CREDENTIALS_FILE,
+                scopes=GOOGLE_SHEETS_SCOPES,
+            )
+            _GS_CLIENT = gspread.authorize(creds)
+        return _GS_CLIENT
+
+
+def open_district_sheet():
+    """The "District4 Data" spreadsheet, opened once per TTL."""
+    global _GS_SPREADSHEET
+    client = get_gs_client()
+    with _GS_LOCK:
+        cached = _GS_SPREADSHEET
+        if cached is None or cached[0] <= time.monotonic() or cached[1] is not client:
+            cached = _GS_SPREADSHEET = (
+                time.monotonic() + GS_HANDLE_TTL_SECONDS,
+                client,
+                client.open("District4 Data"),
+            )
+        return cached[2]
+
+
+def _get_ws(title, create=False, rows=1000, cols=12):
+    """
+    Worksheet handle from the shared spreadsheet, looked up once per spreadsheet handle.
+    create=True adds the tab if it does not exist yet.
+    """
+    sh = open_district_sheet()
+    with _GS_LOCK:
+        cached = _GS_WORKSHEETS.get(title)
+    if cached is not None and cached[0] is sh:
+        return cached[1]
+
+    try:
+        ws = sh.worksheet(title)
+    except gspread.WorksheetNotFound:
+        if not create:
+            raise
+        ws = sh.add_worksheet(title=title, rows=rows, cols=cols)
+
+    with _GS_LOCK:
+        _GS_WORKSHEETS[title] = (sh, ws)
+    return ws
 
 
 def parse_float(value):
+    # Unformatted sheet reads hand numbers over as int/float already (bool stays on the
+    # string path, where it has always parsed as 0.0).
+    t = type(value)
     try:
-        s = str(value).strip()
-        if s == "":
+        if t is float or t is int:
+            return float(value)
+        s = value.strip() if t is str else str(value).strip()
+        if not s:
             return 0.0
-        s = s.replace(",", "")
+        if "," in s:
+            s = s.replace(",", "")
         return float(s)
     except Exception:
         return 0.0
 
 
+def _parse_float_column(values):
+    # Clean numeric columns convert in one C-level map(float); anything with commas,
+    # blanks or text falls back to parse_float per cell (same results either way).
+    # Booleans take the fallback too: float(True) is 1.0, but parse_float gives 0.0.
+    if bool not in set(map(type, values)):
+        try:
+            return list(map(float, values))
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return list(map(parse_float, values))
+
+
 def format_php_currency(value):
     try:
         amount = float(value or 0)
@@ -802,6 +1039,10 @@ def format_php_currency(value):
     return f"₱{amount:,.2f}"
 
 
+# The two shapes Sheets dates come in: ISO YYYY-MM-DD and M/D/YYYY.
+_SHEET_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})|(\d{1,2})/(\d{1,2})/(\d{4})")
+
+
 def parse_sheet_date(value):
     """Parse a date string from Google Sheets.
 
@@ -812,6 +1053,21 @@ def parse_sheet_date(value):
     s = str(value or "").strip()
     if not s:
         return None
+    return _parse_sheet_date_text(s)
+
+
+@lru_cache(maxsize=4096)
+def _parse_sheet_date_text(s):
+    # A sync sees the same few hundred dates over and over; dates are immutable, so cache them.
+    m = _SHEET_DATE_RE.fullmatch(s)
+    if m:
+        y, mo, d, sm, sd, sy = m.groups()
+        try:
+            if y:
+                return date(int(y), int(mo), int(d))
+            return date(int(sy), int(sm), int(sd))
+        except ValueError:
+            return None
     # Try ISO first
     try:
         return date.fromisoformat(s)
@@ -832,6 +1088,25 @@ def _lower(s):
     return str(s or "").strip().lower()
 
 
+# 0-based column index -> A1 column letters (A..Z, AA..ZZ); chr(ord("A") + i) breaks past Z.
+_COL_LETTERS = tuple(
+    [chr(ord("A") + i) for i in range(26)]
+    + [chr(ord("A") + i) + chr(ord("A") + j) for i in range(26) for j in range(26)]
+)
+
+
+def _col_letter(idx):
+    """A1 column letters for a 0-based index; table lookup up to ZZ, base-26 beyond it."""
+    if idx < len(_COL_LETTERS):
+        return _COL_LETTERS[idx]
+    letters = ""
+    n = idx + 1
+    while n:
+        n, r = divmod(n - 1, 26)
+        letters = chr(ord("A") + r) + letters
+    return letters
+
+
 def _find_col(headers, wanted):
     wanted = _lower(wanted)
     for i, h in enumerate(headers):
@@ -840,18 +1115,82 @@ def _find_col(headers, wanted):
     return None
 
 
+def _header_map(headers):
+    """Header row -> {lowercased header: first column index}; same matching as _find_col, O(1) lookups."""
+    hmap = {}
+    for i, h in enumerate(headers):
+        hmap.setdefault(_lower(h), i)
+    return hmap
+
+
+def _sheet_text(value):
+    return str(value).strip()
+
+
+def _row_projector(cols):
+    """
+    cols: [(column_index_or_None, converter), ...] resolved once per sync.
+    Returns row -> tuple of converted cells; missing/short cells convert "".
+    """
+    cols = tuple(cols)
+
+    def project(row):
+        n = len(row)
+        return tuple([conv(row[i]) if i is not None and i < n else conv("") for i, conv in cols])
+
+    return project
+
+
+def _last_row_per_key(rows):
+    """
+    Keeps the last row for each key (column 0), where INSERT OR REPLACE would have left it,
+    so a freshly emptied cache can be filled with plain INSERTs.
+    """
+    out = {}
+    for row in rows:
+        out.pop(row[0], None)
+        out[row[0]] = row
+    return list(out.values())
+
+
 # ==========================
 # ✅ Sheets → DB cache sync
 # ==========================
 
 SYNC_INTERVAL_SECONDS = 300  # 5 minutes
 
+# Read-only "refresh" pages pass max_age: a forced sync that just finished is fresh enough.
+FORCED_SYNC_TTL_SECONDS = 5
+_LAST_FULL_SYNC = {"at": 0.0}
+_LAST_FULL_SYNC_LOCK = threading.Lock()
+
+SHEET_CACHE_TABS = (
+    "Accounts", "Report", "AOPT", "PrayerRequest",
+    "DistrictSchedule", "ChainPrayerSchedules", "Anouncement",
+)
+
+# tab -> queued sheet writes in this process whose rows are already in the local cache
+# (see enqueue_sheets_write). Reloading such a tab would bring back pre-write values.
+_PENDING_WRITE_TABS = {}
+_PENDING_WRITE_TABS_LOCK = threading.Lock()
+
 
-def _last_sync_time_utc():
-    row = get_db().execute("SELECT last_sync FROM sync_state WHERE id = 1").fetchone()
-    if row and row["last_sync"]:
+def _pending_write_tabs():
+    with _PENDING_WRITE_TABS_LOCK:
+        return {tab for tab, n in _PENDING_WRITE_TABS.items() if n}
+
+
+def _count_pending_write(op: str, delta: int):
+    with _PENDING_WRITE_TABS_LOCK:
+        for tab in _OPTIMISTIC_OP_TABS.get(op, ()):
+            _PENDING_WRITE_TABS[tab] = _PENDING_WRITE_TABS.get(tab, 0) + delta
+
+
+def _last_sync_time_utc(column="last_sync"):
+    row = get_db().execute(f"SELECT {column} FROM sync_state WHERE id = 1").fetchone()
+    if row and row[column]:
         try:
-            dt = datetime.fromisoformat(row["last_sync"])
+            dt = datetime.fromisoformat(row[column])
             if dt.tzinfo is None:
                 dt = dt.replace(tzinfo=timezone.utc)
             return dt
@@ -868,17 +1207,17 @@ def get_last_sync_display_ph():
     if not dt_utc:
         return "Never"
     try:
-        dt_utc = dt_utc.replace(tzinfo=ZoneInfo("UTC"))
+        dt_utc = dt_utc.replace(tzinfo=timezone.utc)
         dt_ph = dt_utc.astimezone(PH_TZ)
         return dt_ph.strftime("%b %d, %Y %I:%M %p")
     except Exception:
         return "Unknown"
 
 
-def _update_sync_time():
+def _update_sync_time(at=None):
     get_db().execute(
         "UPDATE sync_state SET last_sync = ? WHERE id = 1",
-        (utc_now_iso(),),
+        ((at or utc_now()).isoformat(),),
     )
     get_db().commit()
     
@@ -902,374 +1241,573 @@ def ensure_schedule_cache_loaded():
     chain_count = int(row_cp["cnt"] or 0) if row_cp else 0
 
     if district_count <= 0 or chain_count <= 0:
-        sync_from_sheets_if_needed(force=True)
+        sync_from_sheets_if_needed(force=True, only={"DistrictSchedule", "ChainPrayerSchedules"})
+
+
+REPORT_CACHE_INSERT_SQL = """
+    INSERT INTO sheet_report_cache (
+        sheet_row, year, month, activity_date,
+        church, pastor, address,
+        adult, youth, children,
+        tithes, offering, personal_tithes, mission_offering,
+        received_jesus, existing_bible_study, new_bible_study,
+        water_baptized, holy_spirit_baptized, childrens_dedication, healed,
+        amount_to_send, status, report_status, row_hash
+    ) VALUES (
+        ?, ?, ?, ?,
+        ?, ?, ?,
+        ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?,
+        ?, ?, ?, ?,
+        ?, ?, ?, ?
+    )
+"""
+
+
+def _report_cache_rows(rep_values):
+    """Report tab values -> parameter tuples for REPORT_CACHE_INSERT_SQL."""
+    if not rep_values or len(rep_values) < 2:
+        return []
+
+    headers = rep_values[0]
+    hmap = _header_map(headers)
+
+    i_activity = hmap.get("activity_date")
+
+    # Church approval status (Approved / Pending) for Church Status colors
+    i_status = hmap.get("status")
+
+    # Print workflow status (MainPrint / LatePrint / Received)
+    i_report_status = hmap.get("reportstatus")
+
+    t, f = _sheet_text, parse_float
+    cols = [
+        (hmap.get("church"), t),
+        (hmap.get("pastor"), t),
+        (hmap.get("address"), t),
+        (hmap.get("adult"), f),
+        (hmap.get("youth"), f),
+        (hmap.get("children"), f),
+        (hmap.get("tithes"), f),
+        (hmap.get("offering"), f),
+        (hmap.get("personal tithes"), f),
+        (hmap.get("mission offering"), f),
+        (hmap.get("received jesus"), f),
+        (hmap.get("existing bible study"), f),
+        (hmap.get("new bible study"), f),
+        (hmap.get("water baptized"), f),
+        (hmap.get("holy spirit baptized"), f),
+        (hmap.get("childrens dedication"), f),
+        (hmap.get("healed"), f),
+        (hmap.get("amount to send"), f),
+        (i_status, t),
+        (i_report_status, t),
+    ]
+
+    keys = []
+    kept = []
+    for sheet_row, row in enumerate(rep_values[1:], start=2):
+        if i_activity is None or i_activity >= len(row):
+            continue
+        activity = str(row[i_activity]).strip()
+        if not activity:
+            continue
+        d = parse_sheet_date(activity)
+        if not d:
+            continue
+        keys.append((sheet_row, d.year, d.month, d.isoformat()))
+        kept.append(row)
+
+    # Convert column by column (struct-of-arrays), then zip back into row tuples.
+    columns = []
+    for i, conv in cols:
+        if i is None:
+            columns.append([conv("")] * len(kept))
+            continue
+        raw = [r[i] if i < len(r) else "" for r in kept]
+        if conv is parse_float:
+            columns.append(_parse_float_column(raw))
+        else:
+            columns.append(list(map(conv, raw)))
+
+    return [k + vals for k, vals in zip(keys, zip(*columns))]
+
+
+def _row_hash(values) -> bytes:
+    return hashlib.blake2b(
+        b"\x1f".join(str(v).encode() for v in values), digest_size=16
+    ).digest()
+
+
+def _write_report_cache(cur, report_rows) -> bool:
+    """
+    Brings sheet_report_cache in line with report_rows (from _report_cache_rows),
+    writing only rows whose content hash changed and deleting rows gone from the sheet.
+    Falls back to a full reload (indexes dropped) when most of the tab changed.
+    Returns True if anything was written.
+    """
+    old_hashes = {
+        r[0]: r[1]
+        for r in cur.execute("SELECT sheet_row, row_hash FROM sheet_report_cache").fetchall()
+    }
+
+    changed = []
+    for t in report_rows:
+        h = _row_hash(t)
+        if old_hashes.pop(t[0], None) != h:
+            changed.append(t + (h,))
+    removed = [(sheet_row,) for sheet_row in old_hashes]
+
+    if not changed and not removed:
+        return False
+
+    if len(changed) * 2 > len(report_rows):
+        _drop_cache_indexes(cur, "sheet_report_cache")
+        cur.execute("DELETE FROM sheet_report_cache")
+        cur.executemany(
+            REPORT_CACHE_INSERT_SQL,
+            [t + (_row_hash(t),) for t in report_rows],
+        )
+        _create_cache_indexes(cur, "sheet_report_cache")
+        return True
+
+    cur.executemany(
+        "DELETE FROM sheet_report_cache WHERE sheet_row = ?",
+        removed + [(t[0],) for t in changed],
+    )
+    cur.executemany(REPORT_CACHE_INSERT_SQL, changed)
+    return True
+
+
+# Report cache reads take raw cell values: numbers arrive as int/float instead of display
+# strings ("1,250.00"), so the numeric columns convert without string parsing.
+# Dates still come back as their displayed text for parse_sheet_date. Text-only tabs
+# are read with FORMATTED_VALUE instead, so they cache what the sheet displays.
+CACHE_VALUE_RENDER_OPTION = "UNFORMATTED_VALUE"
+CACHE_DATE_TIME_RENDER_OPTION = "FORMATTED_STRING"
+
+
+def _get_cache_values(ws, value_render_option=CACHE_VALUE_RENDER_OPTION):
+    return ws.get(
+        value_render_option=value_render_option,
+        date_time_render_option=CACHE_DATE_TIME_RENDER_OPTION,
+    )
+
+
+def _batch_get_sheet_values(sh, titles, value_render_option=CACHE_VALUE_RENDER_OPTION):
+    """
+    Reads several whole tabs with one values.batchGet call.
+    Falls back to reading tab by tab if the batch fails (e.g. a tab is missing),
+    so one bad tab only empties its own cache, as before.
+    """
+    if not titles:
+        return {}
+    ranges = ["'" + t.replace("'", "''") + "'" for t in titles]
+    try:
+        resp = sh.values_batch_get(
+            ranges,
+            params={
+                "valueRenderOption": value_render_option,
+                "dateTimeRenderOption": CACHE_DATE_TIME_RENDER_OPTION,
+            },
+        )
+        value_ranges = resp.get("valueRanges", [])
+        if len(value_ranges) == len(titles):
+            return {t: vr.get("values", []) for t, vr in zip(titles, value_ranges)}
+    except Exception as e:
+        print("❌ Batch sheet read failed, reading tabs one by one:", e)
+
+    out = {}
+    for t in titles:
+        try:
+            out[t] = _get_cache_values(sh.worksheet(t), value_render_option)
+        except Exception as e:
+            print(f"❌ {t} sync failed:", e)
+            out[t] = []
+    return out
+
+
+def _sheet_modified_time_utc(sh):
+    """Drive modifiedTime of the spreadsheet (one metadata call), or None if unavailable."""
+    try:
+        raw = sh.get_lastUpdateTime()
+        dt = datetime.fromisoformat(str(raw).replace("Z", "+00:00"))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt
+    except Exception as e:
+        print("❌ Could not read sheet modifiedTime:", e)
+        return None
+
+
+def _lookup_account(username: str):
+    # Always read SQLite: other workers and the progress monitor rewrite this cache too,
+    # so a per-process copy could keep serving old passwords or deleted accounts.
+    # Both cache writers store usernames stripped, so the PRIMARY KEY lookup matches TRIM().
+    username = (username or "").strip()
+    return get_db().execute(
+        "SELECT * FROM sheet_accounts_cache WHERE username = ?",
+        (username,),
+    ).fetchone()
+
+
+_INTERVAL_SYNC_LOCK = threading.Lock()
+
+
+def _interval_sync_worker():
+    try:
+        with app.app_context():
+            sync_from_sheets_if_needed()
+    except Exception as e:
+        print("❌ Background sync failed:", e)
+    finally:
+        _INTERVAL_SYNC_LOCK.release()
 
 
-def sync_from_sheets_if_needed(force=False):
+def sync_from_sheets_if_needed(force=False, only=None, max_age=None):
     """
     Reads Google Sheets ONLY once per interval, stores into cache tables.
     AO pages read ONLY from cache tables (no quota spam).
+
+    only: optional set of tab names (e.g. {"Accounts"}) to reload just those caches.
+    A partial sync leaves last_sync alone, so the rest still refreshes on schedule.
+
+    max_age: skip when a full sync finished in this process less than max_age seconds ago.
+    Only for refreshes before reads; callers that just wrote to the sheet must not pass it.
     """
+    pending = _pending_write_tabs()
+    if pending and not force:
+        # The worker re-syncs everything once its queued writes land.
+        return
+
+    if max_age is not None:
+        with _LAST_FULL_SYNC_LOCK:
+            if time.monotonic() - _LAST_FULL_SYNC["at"] < max_age:
+                return
+        if pending:
+            # Reload everything except the tabs with queued writes (e.g. a login still
+            # picks up Accounts changes while a prayer edit waits on the worker).
+            only = [t for t in (only or SHEET_CACHE_TABS) if t not in pending]
+            if not only:
+                return
+
+    tabs = None if only is None else set(only)
+
+    def want(tab):
+        return tabs is None or tab in tabs
+
     last = _last_sync_time_utc()
     if not force and last and (utc_now() - last).total_seconds() < SYNC_INTERVAL_SECONDS:
         return
 
+    if not force and last and tabs is None and has_request_context():
+        # Interval refresh from a page: render from the current cache and reload on a
+        # background thread (one at a time) instead of making this visitor wait on Sheets.
+        if _INTERVAL_SYNC_LOCK.acquire(blocking=False):
+            threading.Thread(target=_interval_sync_worker, name="sheets-sync", daemon=True).start()
+        return
+
     try:
-        client = get_gs_client()
-        sh = client.open("District4 Data")
+        sh = open_district_sheet()
     except Exception as e:
         print("❌ Sync failed (open sheet):", e)
         return
 
-    db = get_db()
-    cur = db.cursor()
+    # Interval elapsed: skip the tab downloads if nobody edited the spreadsheet since
+    # this app's last full sync started downloading. That watermark has its own column:
+    # last_sync is also stamped by area_progress_monitor.py, which reads only four tabs
+    # and stamps when it finishes. force=True callers (our own sheet writes) always reload.
+    fetched = _last_sync_time_utc("sheets_fetched_at")
+    if not force and fetched and tabs is None:
+        checked_at = utc_now()
+        modified = _sheet_modified_time_utc(sh)
+        if modified is not None and modified <= fetched:
+            _update_sync_time(checked_at)
+            return
+
+    # Edits made while the tabs are downloading are newer than this, so the next
+    # modifiedTime check still reloads them.
+    fetched_at = utc_now()
+
+    # Fetch first so the write transaction below is never held open over the network.
+    # Only Report is read unformatted, for its column-wise float conversion.
+    rep_values = _batch_get_sheet_values(sh, ["Report"] if want("Report") else []).get("Report", [])
+
+    # The text tabs keep their displayed values (TRUE, 50%, formatted IDs), the same
+    # strings area_progress_monitor.py caches: a second batchGet, since the render
+    # option applies to the whole call.
+    text_values = _batch_get_sheet_values(
+        sh,
+        [
+            t
+            for t in (
+                "Accounts", "AOPT", "PrayerRequest",
+                "DistrictSchedule", "ChainPrayerSchedules", "Anouncement",
+            )
+            if want(t)
+        ],
+        value_render_option="FORMATTED_VALUE",
+    )
+    acc_values = text_values.get("Accounts", [])
+    aopt_values = text_values.get("AOPT", [])
+    pr_values = text_values.get("PrayerRequest", [])
+    ds_values = text_values.get("DistrictSchedule", [])
+    cp_values = text_values.get("ChainPrayerSchedules", [])
+    ann_values = text_values.get("Anouncement", [])
 
     # -----------------------
     # ACCOUNTS (with sheet_row)
     # -----------------------
-    try:
-        ws_accounts = sh.worksheet("Accounts")
-        acc_values = ws_accounts.get_all_values()
-    except Exception as e:
-        print("❌ Accounts sync failed:", e)
-        acc_values = []
-
-    cur.execute("DELETE FROM sheet_accounts_cache")
-
+    accounts_rows = []
     if acc_values and len(acc_values) >= 2:
         headers = acc_values[0]
-        i_name = _find_col(headers, "Name")
-        i_user = _find_col(headers, "UserName")
-        i_pass = _find_col(headers, "Password")
-        i_addr = _find_col(headers, "Church Address")
-        i_age = _find_col(headers, "Area Number")
+        hmap = _header_map(headers)
+        i_age = hmap.get("area number")
         if i_age is None:
-            i_age = _find_col(headers, "Age")
-        i_sex = _find_col(headers, "Church ID")
+            i_age = hmap.get("age")
+        i_sex = hmap.get("church id")
         if i_sex is None:
-            i_sex = _find_col(headers, "Sex")
-        i_contact = _find_col(headers, "Contact #")
-        i_bday = _find_col(headers, "Birth Day")
-        i_pos = _find_col(headers, "Position")
-        i_sub = _find_col(headers, "Sub Area")
+            i_sex = hmap.get("sex")
+        i_sub = hmap.get("sub area")
         if i_sub is None:
-            i_sub = _find_col(headers, "SubArea")
-        i_pin = _find_col(headers, "GooglePinLocation")
-        i_lat = _find_col(headers, "Latitude")
-        i_lng = _find_col(headers, "Longitude")
-
-        def cell(row, idx):
-            if idx is None:
-                return ""
-            if idx < len(row):
-                return row[idx]
-            return ""
-
-        for r in range(1, len(acc_values)):
-            row = acc_values[r]
-
-            username = str(cell(row, i_user)).strip()
-            password = str(cell(row, i_pass)).strip()
-            full_name = str(cell(row, i_name)).strip()
-            church_address = str(cell(row, i_addr)).strip()
-            area_number = str(cell(row, i_age)).strip()
-            church_id = str(cell(row, i_sex)).strip()
-            contact = str(cell(row, i_contact)).strip()
-            birthday = str(cell(row, i_bday)).strip()
-            position = str(cell(row, i_pos)).strip()
-            sub_area = str(cell(row, i_sub)).strip()
-            google_pin_location = str(cell(row, i_pin)).strip()
-            latitude = str(cell(row, i_lat)).strip()
-            longitude = str(cell(row, i_lng)).strip()
+            i_sub = hmap.get("subarea")
+
+        t = _sheet_text
+        project = _row_projector(
+            [
+                (hmap.get("username"), t),
+                (hmap.get("name"), t),
+                (hmap.get("church address"), t),
+                (hmap.get("password"), t),
+                (i_age, t),
+                (i_sex, t),
+                (hmap.get("contact #"), t),
+                (hmap.get("birth day"), t),
+                (hmap.get("position"), t),
+                (i_sub, t),
+                (hmap.get("googlepinlocation"), t),
+                (hmap.get("latitude"), t),
+                (hmap.get("longitude"), t),
+            ]
+        )
 
+        for sheet_row, row in enumerate(acc_values[1:], start=2):
+            vals = project(row)
+            # vals: username, name, church_address, password, area_number, church_id, ...
             # keep rows that have the search essentials even if username/password are blank
-            if not area_number and not church_id and not full_name and not church_address:
+            if not vals[4] and not vals[5] and not vals[1] and not vals[2]:
                 continue
-
-            cur.execute(
-                """
-                INSERT OR REPLACE INTO sheet_accounts_cache
-                (username, name, church_address, password, age, sex, contact, birthday, position, sub_area, google_pin_location, latitude, longitude, sheet_row)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    username,
-                    full_name,
-                    church_address,
-                    password,
-                    area_number,
-                    church_id,
-                    contact,
-                    birthday,
-                    position,
-                    sub_area,
-                    google_pin_location,
-                    latitude,
-                    longitude,
-                    r + 1,
-                ),
-            )
+            accounts_rows.append(vals + (sheet_row,))
 
     # -----------------------
     # REPORT (with sheet_row)
     # -----------------------
-    try:
-        ws_report = sh.worksheet("Report")
-        rep_values = ws_report.get_all_values()
-    except Exception as e:
-        print("❌ Report sync failed:", e)
-        rep_values = []
+    report_rows = _report_cache_rows(rep_values)
 
-    cur.execute("DELETE FROM sheet_report_cache")
-
-    if rep_values and len(rep_values) >= 2:
-        headers = rep_values[0]
+    # -----------------------
+    # AOPT (AO Personal Tithes)
+    # -----------------------
+    aopt_rows = []
+    if aopt_values and len(aopt_values) >= 2:
+        headers = aopt_values[0]
+        hmap = _header_map(headers)
+        i_area = hmap.get("area number")
+        if i_area is None:
+            i_area = hmap.get("area")
+        i_sub_area = hmap.get("sub area")
+        if i_sub_area is None:
+            i_sub_area = hmap.get("subarea")
+
+        project = _row_projector(
+            [
+                (hmap.get("month"), _sheet_text),
+                (i_area, _sheet_text),
+                (i_sub_area, _sheet_text),
+                (hmap.get("amount"), parse_float),
+            ]
+        )
 
-        i_activity = _find_col(headers, "activity_date")
+        # Rows without a Month are skipped.
+        aopt_rows = [
+            vals + (sheet_row,)
+            for sheet_row, vals in enumerate(map(project, aopt_values[1:]), start=2)
+            if vals[0]
+        ]
 
-        # Church approval status (Approved / Pending) for Church Status colors
-        i_status = _find_col(headers, "Status")
-        if i_status is None:
-            i_status = _find_col(headers, "status")
+    # -----------------------
+    # PRAYER REQUEST (PrayerRequest)
+    # -----------------------
+    prayer_rows = []
+    if pr_values and len(pr_values) >= 2:
+        headers = pr_values[0]
+        hmap = _header_map(headers)
+
+        t = _sheet_text
+        project = _row_projector(
+            [
+                (hmap.get("request id"), t),
+                (hmap.get("church name"), t),
+                (hmap.get("submitted by"), t),
+                (hmap.get("prayer request title"), t),
+                (hmap.get("prayer request date"), t),
+                (hmap.get("prayer request"), t),
+                (hmap.get("status"), t),
+                (hmap.get("pastor's praying"), t),
+                (hmap.get("answered date"), t),
+            ]
+        )
 
-        # Print workflow status (MainPrint / LatePrint / Received)
-        i_report_status = _find_col(headers, "ReportStatus")
+        # Rows without a Request ID are skipped.
+        prayer_rows = [
+            vals + (sheet_row,)
+            for sheet_row, vals in enumerate(map(project, pr_values[1:]), start=2)
+            if vals[0]
+        ]
 
-        i_church = _find_col(headers, "church")
-        i_pastor = _find_col(headers, "pastor")
-        i_address = _find_col(headers, "address")
+    # -----------------------
+    # DISTRICT SCHEDULE
+    # -----------------------
+    ds_rows = []
+    if ds_values and len(ds_values) >= 2:
+        hmap = _header_map(ds_values[0])
+
+        t = _sheet_text
+        project = _row_projector(
+            [
+                (hmap.get("church name"), t),
+                (hmap.get("church address"), t),
+                (hmap.get("pastor's name"), t),
+                (hmap.get("contact number"), t),
+                (hmap.get("activity date start"), t),
+                (hmap.get("activity date end"), t),
+                (hmap.get("activity type"), t),
+                (hmap.get("note"), t),
+                (hmap.get("joining"), t),
+                (hmap.get("theme"), t),
+                (hmap.get("text"), t),
+            ]
+        )
 
-        i_adult = _find_col(headers, "adult")
-        i_youth = _find_col(headers, "youth")
-        i_children = _find_col(headers, "children")
+        # Rows without a Church Name or Activity Date Start are skipped.
+        ds_rows = [
+            vals + (sheet_row,)
+            for sheet_row, vals in enumerate(map(project, ds_values[1:]), start=2)
+            if vals[0] and vals[4]
+        ]
 
-        i_tithes = _find_col(headers, "tithes")
-        i_offering = _find_col(headers, "offering")
-        i_personal = _find_col(headers, "personal tithes")
-        i_mission = _find_col(headers, "mission offering")
+    # -----------------------
+    # CHAIN PRAYER SCHEDULE
+    # -----------------------
+    cp_rows = []
+    if cp_values and len(cp_values) >= 2:
+        hmap = _header_map(cp_values[0])
+
+        t = _sheet_text
+        project = _row_projector(
+            [
+                (hmap.get("churchnameassigned"), t),
+                (hmap.get("pastor"), t),
+                (hmap.get("date"), t),
+            ]
+        )
 
-        i_recv = _find_col(headers, "received jesus")
-        i_exist = _find_col(headers, "existing bible study")
-        i_new = _find_col(headers, "new bible study")
-        i_water = _find_col(headers, "water baptized")
-        i_holy = _find_col(headers, "holy spirit baptized")
-        i_ded = _find_col(headers, "childrens dedication")
-        i_healed = _find_col(headers, "healed")
+        # Rows without a ChurchNameAssigned or Date are skipped.
+        cp_rows = [
+            vals + (sheet_row,)
+            for sheet_row, vals in enumerate(map(project, cp_values[1:]), start=2)
+            if vals[0] and vals[2]
+        ]
 
-        i_send = _find_col(headers, "amount to send")
+    # -----------------------
+    # ANOUNCEMENT
+    # -----------------------
+    ann_rows = []
+    if ann_values and len(ann_values) >= 2:
+        hmap = _header_map(ann_values[0])
+        i_sub = hmap.get("subarea")
+        if i_sub is None:
+            i_sub = hmap.get("sub area")
+
+        t = _sheet_text
+        project = _row_projector(
+            [
+                (hmap.get("title"), t),
+                (hmap.get("announcement"), t),
+                (hmap.get("date"), t),
+                (hmap.get("area"), t),
+                (i_sub, t),
+                (hmap.get("author username"), t),
+                (hmap.get("author name"), t),
+            ]
+        )
 
-        def cell(row, idx):
-            if idx is None:
-                return ""
-            if idx < len(row):
-                return row[idx]
-            return ""
+        # Rows with neither a Title nor an Announcement are skipped.
+        ann_rows = [
+            vals + (sheet_row,)
+            for sheet_row, vals in enumerate(map(project, ann_values[1:]), start=2)
+            if vals[0] or vals[1]
+        ]
 
-        for r in range(1, len(rep_values)):
-            row = rep_values[r]
-            activity = str(cell(row, i_activity)).strip()
-            if not activity:
-                continue
-            d = parse_sheet_date(activity)
-            if not d:
-                continue
+    # One write transaction for all requested caches: readers never see a half-loaded cache,
+    # and sqlite journals once instead of once per row.
+    db = get_db()
+    if db.in_transaction:
+        db.commit()
+    cur = db.cursor()
+    try:
+        cur.execute("BEGIN IMMEDIATE")
 
-            cur.execute(
+        if want("Accounts"):
+            _drop_cache_indexes(cur, "sheet_accounts_cache")
+            cur.execute("DELETE FROM sheet_accounts_cache")
+            cur.executemany(
                 """
-                INSERT INTO sheet_report_cache (
-                    sheet_row, year, month, activity_date,
-                    church, pastor, address,
-                    adult, youth, children,
-                    tithes, offering, personal_tithes, mission_offering,
-                    received_jesus, existing_bible_study, new_bible_study,
-                    water_baptized, holy_spirit_baptized, childrens_dedication, healed,
-                    amount_to_send, status, report_status
-                ) VALUES (
-                    ?, ?, ?, ?,
-                    ?, ?, ?,
-                    ?, ?, ?,
-                    ?, ?, ?, ?,
-                    ?, ?, ?,
-                    ?, ?, ?, ?,
-                    ?, ?, ?
-                )
+                INSERT INTO sheet_accounts_cache
+                (username, name, church_address, password, age, sex, contact, birthday, position, sub_area, google_pin_location, latitude, longitude, sheet_row)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    r + 1,
-                    d.year,
-                    d.month,
-                    d.isoformat(),
-                    str(cell(row, i_church)).strip(),
-                    str(cell(row, i_pastor)).strip(),
-                    str(cell(row, i_address)).strip(),
-                    parse_float(cell(row, i_adult)),
-                    parse_float(cell(row, i_youth)),
-                    parse_float(cell(row, i_children)),
-                    parse_float(cell(row, i_tithes)),
-                    parse_float(cell(row, i_offering)),
-                    parse_float(cell(row, i_personal)),
-                    parse_float(cell(row, i_mission)),
-                    parse_float(cell(row, i_recv)),
-                    parse_float(cell(row, i_exist)),
-                    parse_float(cell(row, i_new)),
-                    parse_float(cell(row, i_water)),
-                    parse_float(cell(row, i_holy)),
-                    parse_float(cell(row, i_ded)),
-                    parse_float(cell(row, i_healed)),
-                    parse_float(cell(row, i_send)),
-                    str(cell(row, i_status)).strip(),
-                    str(cell(row, i_report_status)).strip(),
-                ),
+                _last_row_per_key(accounts_rows),
             )
+            _create_cache_indexes(cur, "sheet_accounts_cache")
 
-    # -----------------------
-    # AOPT (AO Personal Tithes)
-    # -----------------------
-    try:
-        ws_aopt = sh.worksheet("AOPT")
-        aopt_values = ws_aopt.get_all_values()
-    except Exception as e:
-        print("❌ AOPT sync failed:", e)
-        aopt_values = []
-
-    cur.execute("DELETE FROM sheet_aopt_cache")
-
-    if aopt_values and len(aopt_values) >= 2:
-        headers = aopt_values[0]
-        i_month = _find_col(headers, "Month")
-        i_amount = _find_col(headers, "Amount")
-        i_area = _find_col(headers, "Area Number")
-        if i_area is None:
-            i_area = _find_col(headers, "Area")
-        i_sub_area = _find_col(headers, "Sub Area")
-        if i_sub_area is None:
-            i_sub_area = _find_col(headers, "SubArea")
-
-        def cell(row, idx):
-            if idx is None:
-                return ""
-            if idx < len(row):
-                return row[idx]
-            return ""
-
-        for r in range(1, len(aopt_values)):
-            row = aopt_values[r]
-            month_label = str(cell(row, i_month)).strip()
-            if not month_label:
-                continue
-            amount_val = parse_float(cell(row, i_amount))
-            area_number = str(cell(row, i_area)).strip()
-            sub_area = str(cell(row, i_sub_area)).strip()
+        report_changed = False
+        if want("Report"):
+            report_changed = _write_report_cache(cur, report_rows)
+        if rep_values:
             cur.execute(
+                "UPDATE sync_state SET report_status_col = ? WHERE id = 1",
+                (_find_col(rep_values[0], "status"),),
+            )
+
+        if want("AOPT"):
+            cur.execute("DELETE FROM sheet_aopt_cache")
+            cur.executemany(
                 """
                 INSERT OR REPLACE INTO sheet_aopt_cache (month, area_number, sub_area, amount, sheet_row)
                 VALUES (?, ?, ?, ?, ?)
                 """,
-                (month_label, area_number, sub_area, amount_val, r + 1),
+                aopt_rows,
             )
 
-    # -----------------------
-    # PRAYER REQUEST (PrayerRequest)
-    # -----------------------
-    try:
-        ws_pr = sh.worksheet("PrayerRequest")
-        pr_values = ws_pr.get_all_values()
-    except Exception as e:
-        print("❌ PrayerRequest sync failed:", e)
-        pr_values = []
-
-    cur.execute("DELETE FROM sheet_prayer_request_cache")
-
-    if pr_values and len(pr_values) >= 2:
-        headers = pr_values[0]
-
-        i_church = _find_col(headers, "Church Name")
-        i_submitted_by = _find_col(headers, "Submitted By")
-        i_request_id = _find_col(headers, "Request ID")
-        i_title = _find_col(headers, "Prayer Request Title")
-        i_request_date = _find_col(headers, "Prayer Request Date")
-        i_request_text = _find_col(headers, "Prayer Request")
-        i_status = _find_col(headers, "status")
-        if i_status is None:
-            i_status = _find_col(headers, "status")
-        i_praying = _find_col(headers, "Pastor's Praying")
-        i_answered = _find_col(headers, "Answered Date")
-
-        def cell(row, idx):
-            if idx is None:
-                return ""
-            if idx < len(row):
-                return row[idx]
-            return ""
-
-        for r in range(1, len(pr_values)):
-            row = pr_values[r]
-            req_id = str(cell(row, i_request_id)).strip()
-            if not req_id:
-                continue
-
-            cur.execute(
+        if want("PrayerRequest"):
+            _drop_cache_indexes(cur, "sheet_prayer_request_cache")
+            cur.execute("DELETE FROM sheet_prayer_request_cache")
+            cur.executemany(
                 """
-                INSERT OR REPLACE INTO sheet_prayer_request_cache (
+                INSERT INTO sheet_prayer_request_cache (
                     request_id, church_name, submitted_by, title, request_date,
                     request_text, status, pastors_praying, answered_date, sheet_row
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    req_id,
-                    str(cell(row, i_church)).strip(),
-                    str(cell(row, i_submitted_by)).strip(),
-                    str(cell(row, i_title)).strip(),
-                    str(cell(row, i_request_date)).strip(),
-                    str(cell(row, i_request_text)).strip(),
-                    str(cell(row, i_status)).strip(),
-                    str(cell(row, i_praying)).strip(),
-                    str(cell(row, i_answered)).strip(),
-                    r + 1,
-                ),
+                _last_row_per_key(prayer_rows),
             )
+            _create_cache_indexes(cur, "sheet_prayer_request_cache")
 
-    db.commit()
-    # -----------------------
-    # DISTRICT SCHEDULE
-    # -----------------------
-    try:
-        ws_ds = sh.worksheet("DistrictSchedule")
-        ds_values = ws_ds.get_all_values()
-    except Exception as e:
-        print("❌ DistrictSchedule sync failed:", e)
-        ds_values = []
-
-    cur.execute("DELETE FROM sheet_district_schedule_cache")
-
-    if ds_values and len(ds_values) >= 2:
-        headers = ds_values[0]
-
-        i_church_name = _find_col(headers, "Church Name")
-        i_church_address = _find_col(headers, "Church Address")
-        i_pastor_name = _find_col(headers, "Pastor's Name")
-        i_contact_number = _find_col(headers, "Contact Number")
-        i_activity_start = _find_col(headers, "Activity Date Start")
-        i_activity_end = _find_col(headers, "Activity Date End")
-        i_activity_type = _find_col(headers, "Activity Type")
-        i_note = _find_col(headers, "Note")
-        i_joining = _find_col(headers, "Joining")
-        i_theme = _find_col(headers, "Theme")
-        i_text = _find_col(headers, "Text")
-
-        def ds_cell(row, idx):
-            if idx is None:
-                return ""
-            return row[idx].strip() if idx < len(row) else ""
-
-        for rnum, row in enumerate(ds_values[1:], start=2):
-            church_name = ds_cell(row, i_church_name)
-            activity_start = ds_cell(row, i_activity_start)
-
-            if not church_name or not activity_start:
-                continue
-
-            cur.execute(
+        if want("DistrictSchedule"):
+            _drop_cache_indexes(cur, "sheet_district_schedule_cache")
+            cur.execute("DELETE FROM sheet_district_schedule_cache")
+            cur.executemany(
                 """
                 INSERT INTO sheet_district_schedule_cache (
                     church_name,
@@ -1287,54 +1825,14 @@ def sync_from_sheets_if_needed(force=False):
                 )
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    church_name,
-                    ds_cell(row, i_church_address),
-                    ds_cell(row, i_pastor_name),
-                    ds_cell(row, i_contact_number),
-                    activity_start,
-                    ds_cell(row, i_activity_end),
-                    ds_cell(row, i_activity_type),
-                    ds_cell(row, i_note),
-                    ds_cell(row, i_joining),
-                    ds_cell(row, i_theme),
-                    ds_cell(row, i_text),
-                    rnum,
-                ),
-            )
-        # -----------------------
-    # CHAIN PRAYER SCHEDULE
-    # -----------------------
-    try:
-        ws_cp = sh.worksheet("ChainPrayerSchedules")
-        cp_values = ws_cp.get_all_values()
-    except Exception as e:
-        print("❌ ChainPrayerSchedules sync failed:", e)
-        cp_values = []
-
-    cur.execute("DELETE FROM sheet_chain_prayer_schedule_cache")
-
-    if cp_values and len(cp_values) >= 2:
-        headers = cp_values[0]
-
-        i_church_name_assigned = _find_col(headers, "ChurchNameAssigned")
-        i_pastor_name = _find_col(headers, "Pastor")
-        i_prayer_date = _find_col(headers, "Date")
-
-        def cp_cell(row, idx):
-            if idx is None:
-                return ""
-            return row[idx].strip() if idx < len(row) else ""
-
-        for rnum, row in enumerate(cp_values[1:], start=2):
-            church_name_assigned = cp_cell(row, i_church_name_assigned)
-            pastor_name = cp_cell(row, i_pastor_name)
-            prayer_date = cp_cell(row, i_prayer_date)
-
-            if not church_name_assigned or not prayer_date:
-                continue
+                ds_rows,
+            )
+            _create_cache_indexes(cur, "sheet_district_schedule_cache")
 
-            cur.execute(
+        if want("ChainPrayerSchedules"):
+            _drop_cache_indexes(cur, "sheet_chain_prayer_schedule_cache")
+            cur.execute("DELETE FROM sheet_chain_prayer_schedule_cache")
+            cur.executemany(
                 """
                 INSERT INTO sheet_chain_prayer_schedule_cache (
                     church_name_assigned,
@@ -1344,69 +1842,54 @@ def sync_from_sheets_if_needed(force=False):
                 )
                 VALUES (?, ?, ?, ?)
                 """,
-                (
-                    church_name_assigned,
-                    pastor_name,
-                    prayer_date,
-                    rnum,
-                ),
+                cp_rows,
             )
+            _create_cache_indexes(cur, "sheet_chain_prayer_schedule_cache")
 
-    # -----------------------
-    # ANOUNCEMENT
-    # -----------------------
-    try:
-        ws_ann = sh.worksheet("Anouncement")
-        ann_values = ws_ann.get_all_values()
-    except Exception as e:
-        print("❌ Anouncement sync failed:", e)
-        ann_values = []
-
-    cur.execute("DELETE FROM sheet_announcement_cache")
-
-    if ann_values and len(ann_values) >= 2:
-        headers = ann_values[0]
-        i_title = _find_col(headers, "Title")
-        i_announcement = _find_col(headers, "Announcement")
-        i_date = _find_col(headers, "Date")
-        i_area = _find_col(headers, "Area")
-        i_sub = _find_col(headers, "SubArea")
-        if i_sub is None:
-            i_sub = _find_col(headers, "Sub Area")
-        i_author_u = _find_col(headers, "Author Username")
-        i_author_n = _find_col(headers, "Author Name")
-
-        def ann_cell(row, idx):
-            if idx is None:
-                return ""
-            return row[idx].strip() if idx < len(row) else ""
-
-        for rnum, row in enumerate(ann_values[1:], start=2):
-            title = ann_cell(row, i_title)
-            body = ann_cell(row, i_announcement)
-            if not title and not body:
-                continue
-            cur.execute(
+        if want("Anouncement"):
+            _drop_cache_indexes(cur, "sheet_announcement_cache")
+            cur.execute("DELETE FROM sheet_announcement_cache")
+            cur.executemany(
                 """
                 INSERT INTO sheet_announcement_cache (
                     title, announcement, announcement_date, area, sub_area,
                     author_username, author_name, sheet_row
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    title,
-                    body,
-                    ann_cell(row, i_date),
-                    ann_cell(row, i_area),
-                    ann_cell(row, i_sub),
-                    ann_cell(row, i_author_u),
-                    ann_cell(row, i_author_n),
-                    rnum,
-                ),
+                ann_rows,
+            )
+            _create_cache_indexes(cur, "sheet_announcement_cache")
+
+        # Fresh stats let the planner use both TRIM indexes for "address OR church" (MULTI-INDEX OR).
+        cur.execute("PRAGMA analysis_limit = 400")
+        if report_changed:
+            cur.execute("ANALYZE sheet_report_cache")
+        if want("Accounts"):
+            cur.execute("ANALYZE sheet_accounts_cache")
+
+        if tabs is None:
+            # Same transaction: last_sync only moves when the caches it vouches for commit.
+            cur.execute(
+                "UPDATE sync_state SET sheets_fetched_at = ? WHERE id = 1",
+                (fetched_at.isoformat(),),
             )
+            _update_sync_time()
+        else:
+            db.commit()
+    except Exception as e:
+        db.rollback()
+        print("❌ Sync failed (cache write):", e)
+        return
 
+    if want("Accounts"):
+        # Accounts were reloaded: let refresh_pastor_from_cache() look again.
+        g.pop("_pastor_refreshed", None)
 
-    _update_sync_time()
+    if tabs is None:
+        with _LAST_FULL_SYNC_LOCK:
+            _LAST_FULL_SYNC["at"] = time.monotonic()
+        # Pick up hand-edited header rows at most one sync interval late.
+        _HEADER_ROWS.clear()
     print("✅ Sheets cache sync done.")
 
 
@@ -1454,33 +1937,120 @@ def get_aopt_amount_from_cache(month_label: str, area_number: str = "", sub_area
     return None
 
 
-def _ensure_aopt_headers(ws):
-    values = ws.get_all_values()
-    headers = ["Month", "Amount", "Area", "SubArea"]
-    if not values:
-        ws.append_row(headers, value_input_option="USER_ENTERED")
-        return headers
+def get_aopt_amounts_from_cache(month_labels, area_number: str = "", sub_area: str = ""):
+    """{month_label: amount} for several labels in one query; same fallbacks as get_aopt_amount_from_cache."""
+    month_labels = list(month_labels)
+    area_number = str(area_number or "").strip()
+    sub_area = str(sub_area or "").strip()
+    if not month_labels:
+        return {}
+
+    rows = get_db().execute(
+        f"""
+        SELECT
+            month,
+            amount,
+            TRIM(area_number) = TRIM(?) AND TRIM(COALESCE(sub_area,'')) = TRIM(?) AS sub_match,
+            TRIM(area_number) = TRIM(?) AND TRIM(COALESCE(sub_area,'')) = '' AS area_match
+        FROM sheet_aopt_cache
+        WHERE month IN ({", ".join("?" for _ in month_labels)})
+        ORDER BY sheet_row
+        """,
+        (area_number, sub_area, area_number, *month_labels),
+    ).fetchall()
+
+    # Ascending sheet_row: the last assignment per label is the ORDER BY sheet_row DESC LIMIT 1 pick.
+    by_sub, by_area, by_any = {}, {}, {}
+    for r in rows:
+        if r["sub_match"]:
+            by_sub[r["month"]] = r["amount"]
+        if r["area_match"]:
+            by_area[r["month"]] = r["amount"]
+        by_any[r["month"]] = r["amount"]
+
+    amounts = {}
+    for label in month_labels:
+        if sub_area and label in by_sub:
+            amounts[label] = by_sub[label]
+        elif label in by_area:
+            amounts[label] = by_area[label]
+        elif not area_number:
+            amounts[label] = by_any.get(label)
+        else:
+            amounts[label] = None
+    return amounts
+
+
+# worksheet id -> (worksheet handle, header row); reused while _get_ws() returns the same handle.
+_HEADER_ROWS = {}
+
+
+def _header_row(ws):
+    """Row 1 of ws, read with row_values(1) once per worksheet handle (never the data rows)."""
+    cached = _HEADER_ROWS.get(ws.id)
+    if cached is not None and cached[0] is ws:
+        return list(cached[1])
+    headers = ws.row_values(1)
+    _HEADER_ROWS[ws.id] = (ws, list(headers))
+    return list(headers)
+
+
+def _header_index(ws):
+    """{lowercased header: column index} for ws's header row (see _header_map)."""
+    return _header_map(_header_row(ws))
+
+
+def _invalidate_headers(ws, headers=None):
+    """Call after writing row 1: remember what was written, or forget the row."""
+    if headers is None:
+        _HEADER_ROWS.pop(ws.id, None)
+    else:
+        _HEADER_ROWS[ws.id] = (ws, list(headers))
+
+
+def _ensure_header_row(ws, headers, is_present=None):
+    """
+    Make sure every name in headers is in row 1, writing missing ones at their default
+    position. is_present(current, name) overrides the plain _find_col check (aliases).
+    """
+    current = _header_row(ws)
+    if not current:
+        ws.update(f"A1:{_col_letter(len(headers) - 1)}1", [headers], value_input_option="USER_ENTERED")
+        _invalidate_headers(ws, headers)
+        return list(headers)
 
-    current = list(values[0])
-    needed = [("Month",0), ("Amount",1), ("Area",2), ("SubArea",3)]
     changed = False
-    for name, pos in needed:
-        if _find_col(current, name) is None and not (name=="Area" and _find_col(current, "Area Number") is not None) and not (name=="SubArea" and _find_col(current, "Sub Area") is not None):
+    for pos, name in enumerate(headers):
+        present = is_present(current, name) if is_present else _find_col(current, name) is not None
+        if not present:
             while len(current) <= pos:
                 current.append("")
             current[pos] = name
             changed = True
     if changed:
-        rng = f"A1:{chr(ord('A') + len(current) - 1)}1"
+        rng = f"A1:{_col_letter(len(current) - 1)}1"
         ws.update(rng, [current], value_input_option="USER_ENTERED")
-        values = ws.get_all_values()
-        return values[0]
+        _invalidate_headers(ws, current)
     return current
 
 
+def _aopt_header_present(current, name):
+    if _find_col(current, name) is not None:
+        return True
+    if name == "Area":
+        return _find_col(current, "Area Number") is not None
+    if name == "SubArea":
+        return _find_col(current, "Sub Area") is not None
+    return False
+
+
+def _ensure_aopt_headers(ws):
+    return _ensure_header_row(ws, ["Month", "Amount", "Area", "SubArea"], _aopt_header_present)
+
+
 def _get_report_print_sheet(report_type: str = "ao", print_action: str = "main"):
     client = get_gs_client()
-    sh = client.open("District4 Data")
+    sh = open_district_sheet()
     report_type = str(report_type or "ao").strip()
     print_action = str(print_action or "main").strip().lower()
 
@@ -1489,7 +2059,7 @@ def _get_report_print_sheet(report_type: str = "ao", print_action: str = "main")
     else:
         sheet_name = "Late AO Report Print" if print_action == "late" else "AO Report Print"
 
-    ws = sh.worksheet(sheet_name)
+    ws = _get_ws(sheet_name)
     return client, sh, ws
 
 
@@ -1508,10 +2078,9 @@ def _prepare_report_print_sheet_direct(area_number: str, year: int, month: int,
 
 
 def _get_report_status_column(ws):
-    values = ws.get_all_values()
-    if not values:
+    headers = _header_row(ws)
+    if not headers:
         return None, []
-    headers = values[0]
     idx = _find_col(headers, "ReportStatus")
     if idx is None:
         idx = _find_col(headers, "status")
@@ -1668,19 +2237,36 @@ def _get_report_status_map_for_scope(year: int, month: int, area_number: str, su
     return {rec["church_key"]: rec["status"] for rec in _get_report_status_records_for_scope(year, month, area_number, sub_area)}
 
 
+def _column_run_ranges(col_letter: str, sheet_rows, value):
+    """
+    batch_update body writing `value` into one column for every sheet row,
+    with contiguous rows coalesced into a single A1 range (J5:J9 instead of J5..J9).
+    """
+    body = []
+    rows = sorted(set(int(x) for x in sheet_rows if x))
+    if not rows:
+        return body
+    start = prev = rows[0]
+    for r in rows[1:] + [None]:
+        if r is not None and r == prev + 1:
+            prev = r
+            continue
+        a1 = f"{col_letter}{start}" if start == prev else f"{col_letter}{start}:{col_letter}{prev}"
+        body.append({"range": a1, "values": [[value]] * (prev - start + 1)})
+        if r is not None:
+            start = prev = r
+    return body
+
+
 def _sheet_batch_update_report_status_rows(sheet_rows, status_label: str):
     if not sheet_rows:
         return
-    client = get_gs_client()
-    sh = client.open("District4 Data")
-    ws = sh.worksheet("Report")
+    ws = _get_ws("Report")
     idx, headers = _get_report_status_column(ws)
     if idx is None:
         raise RuntimeError("Report sheet missing ReportStatus/status header")
-    col_letter = chr(ord('A') + idx)
-    requests_body = []
-    for r in sorted(set(int(x) for x in sheet_rows if x)):
-        requests_body.append({"range": f"{col_letter}{r}", "values": [[status_label]]})
+    col_letter = _col_letter(idx)
+    requests_body = _column_run_ranges(col_letter, sheet_rows, status_label)
     if requests_body:
         ws.batch_update(requests_body)
 
@@ -1692,114 +2278,25 @@ def _sync_report_cache_only():
     Keeps Church Status/print buttons in sync without reloading all sheets.
     """
     try:
-        client = get_gs_client()
-        sh = client.open("District4 Data")
-        ws_report = sh.worksheet("Report")
-        rep_values = ws_report.get_all_values()
+        ws_report = _get_ws("Report")
+        rep_values = _get_cache_values(ws_report)
     except Exception as e:
         print("❌ Report-only sync failed:", e)
         return
 
+    report_rows = _report_cache_rows(rep_values)
+
     db = get_db()
     cur = db.cursor()
-    cur.execute("DELETE FROM sheet_report_cache")
-
-    if rep_values and len(rep_values) >= 2:
-        headers = rep_values[0]
-
-        i_activity = _find_col(headers, "activity_date")
-        i_status = _find_col(headers, "Status")
-        if i_status is None:
-            i_status = _find_col(headers, "status")
-        i_report_status = _find_col(headers, "ReportStatus")
-
-        i_church = _find_col(headers, "church")
-        i_pastor = _find_col(headers, "pastor")
-        i_address = _find_col(headers, "address")
-
-        i_adult = _find_col(headers, "adult")
-        i_youth = _find_col(headers, "youth")
-        i_children = _find_col(headers, "children")
-
-        i_tithes = _find_col(headers, "tithes")
-        i_offering = _find_col(headers, "offering")
-        i_personal = _find_col(headers, "personal tithes")
-        i_mission = _find_col(headers, "mission offering")
-
-        i_recv = _find_col(headers, "received jesus")
-        i_exist = _find_col(headers, "existing bible study")
-        i_new = _find_col(headers, "new bible study")
-        i_water = _find_col(headers, "water baptized")
-        i_holy = _find_col(headers, "holy spirit baptized")
-        i_ded = _find_col(headers, "childrens dedication")
-        i_healed = _find_col(headers, "healed")
-
-        i_send = _find_col(headers, "amount to send")
-
-        def cell(row, idx):
-            if idx is None:
-                return ""
-            return row[idx] if idx < len(row) else ""
-
-        for r in range(1, len(rep_values)):
-            row = rep_values[r]
-            activity = str(cell(row, i_activity)).strip()
-            if not activity:
-                continue
-            d = parse_sheet_date(activity)
-            if not d:
-                continue
-
-            cur.execute(
-                """
-                INSERT INTO sheet_report_cache (
-                    sheet_row, year, month, activity_date,
-                    church, pastor, address,
-                    adult, youth, children,
-                    tithes, offering, personal_tithes, mission_offering,
-                    received_jesus, existing_bible_study, new_bible_study,
-                    water_baptized, holy_spirit_baptized, childrens_dedication, healed,
-                    amount_to_send, status, report_status
-                ) VALUES (
-                    ?, ?, ?, ?,
-                    ?, ?, ?,
-                    ?, ?, ?,
-                    ?, ?, ?, ?,
-                    ?, ?, ?,
-                    ?, ?, ?, ?,
-                    ?, ?, ?
-                )
-                """,
-                (
-                    r + 1,
-                    d.year,
-                    d.month,
-                    d.isoformat(),
-                    str(cell(row, i_church)).strip(),
-                    str(cell(row, i_pastor)).strip(),
-                    str(cell(row, i_address)).strip(),
-                    parse_float(cell(row, i_adult)),
-                    parse_float(cell(row, i_youth)),
-                    parse_float(cell(row, i_children)),
-                    parse_float(cell(row, i_tithes)),
-                    parse_float(cell(row, i_offering)),
-                    parse_float(cell(row, i_personal)),
-                    parse_float(cell(row, i_mission)),
-                    parse_float(cell(row, i_recv)),
-                    parse_float(cell(row, i_exist)),
-                    parse_float(cell(row, i_new)),
-                    parse_float(cell(row, i_water)),
-                    parse_float(cell(row, i_holy)),
-                    parse_float(cell(row, i_ded)),
-                    parse_float(cell(row, i_healed)),
-                    parse_float(cell(row, i_send)),
-                    str(cell(row, i_status)).strip(),
-                    str(cell(row, i_report_status)).strip(),
-                ),
-            )
+    _write_report_cache(cur, report_rows)
+    if rep_values:
+        cur.execute(
+            "UPDATE sync_state SET report_status_col = ? WHERE id = 1",
+            (_find_col(rep_values[0], "status"),),
+        )
 
+    # last_sync stays put: it vouches for every tab, and only the Report tab was reloaded.
     db.commit()
-    _update_sync_time()
 
 
 def _reset_report_status_for_scope(year: int, month: int, area_number: str, sub_area: str = ""):
@@ -2102,16 +2599,20 @@ def refresh_pastor_from_cache():
     if not username:
         return False
 
-    row = get_db().execute(
-        "SELECT name, church_address, sex FROM sheet_accounts_cache WHERE username = ?",
-        (username,),
-    ).fetchone()
+    # Hot helpers call this several times per request; look the pastor up once.
+    cached = getattr(g, "_pastor_refreshed", None)
+    if cached is not None and cached[0] == username:
+        return cached[1]
+
+    row = _lookup_account(username)
     if not row:
+        g._pastor_refreshed = (username, False)
         return False
 
     session["pastor_name"] = row["name"] or ""
     session["pastor_church_address"] = row["church_address"] or ""
     session["pastor_church_id"] = row["sex"] or ""
+    g._pastor_refreshed = (username, True)
     return True
 
 
@@ -2156,6 +2657,11 @@ def _dirty_key(year: int, month: int) -> str:
 def mark_month_dirty(year: int, month: int):
     session[_dirty_key(year, month)] = True
 
+def _clear_cache_digest(cur, monthly_report_id: int):
+    # Call in the same transaction as a local sunday_reports / church_progress edit,
+    # so the next cache copy is not skipped as "already copied".
+    cur.execute("UPDATE monthly_reports SET cache_digest = NULL WHERE id = ?", (monthly_report_id,))
+
 def clear_month_dirty(year: int, month: int):
     session.pop(_dirty_key(year, month), None)
 
@@ -2183,9 +2689,17 @@ def sync_local_month_from_cache_for_pastor(year: int, month: int):
     db = get_db()
     cur = db.cursor()
 
-    cached_rows = db.execute(
+    # Plain tuples in a fixed column order, unpacked positionally below.
+    tuple_cur = db.cursor()
+    tuple_cur.row_factory = None
+    cached_rows = tuple_cur.execute(
         """
-        SELECT *
+        SELECT
+            activity_date, status,
+            adult, youth, children,
+            tithes, offering, mission_offering, personal_tithes,
+            new_bible_study, existing_bible_study, received_jesus,
+            water_baptized, holy_spirit_baptized, healed, childrens_dedication
         FROM sheet_report_cache
         WHERE year = ? AND month = ?
           AND (
@@ -2203,132 +2717,108 @@ def sync_local_month_from_cache_for_pastor(year: int, month: int):
     mr = get_or_create_monthly_report(year, month, pastor_username)
     mrid = mr["id"]
 
+    # Same cache slice as the last copy: the local rows already match, skip the rewrite.
+    # The digest is stored on the monthly_reports row, so every worker process sees it.
+    digest = hashlib.blake2b(repr(cached_rows).encode("utf-8"), digest_size=16).digest()
+    if mr["cache_digest"] == digest:
+        return
+
     ensure_sunday_reports(mrid, year, month)
 
-    statuses = set()
+    approved = 0
     cp_seed = None
 
-    for r in cached_rows:
-        activity_date = str(r["activity_date"] or "").strip()
+    # Later cache rows for the same date win, as they did with row-by-row upserts.
+    by_date = {}
+    for (
+        activity_date, status,
+        adult, youth, children,
+        tithes, offering, mission_offering, personal_tithes,
+        *progress,
+    ) in cached_rows:
+        activity_date = str(activity_date or "").strip()
         if not activity_date:
             continue
         d = parse_sheet_date(activity_date)
         if not d:
             continue
 
-        statuses.add(str(r["status"] or "").strip())
+        if not approved and "approved" in str(status or "").lower():
+            approved = 1
 
         if cp_seed is None:
-            cp_seed = r
+            # new/existing bible study, received jesus, water/holy spirit baptized, healed, dedication
+            cp_seed = progress
+
+        by_date[d.isoformat()] = (
+            mrid, d.isoformat(), d.year, d.month, d.day,
+            float(adult or 0),
+            float(youth or 0),
+            float(children or 0),
+            float(tithes or 0),
+            float(offering or 0),
+            float(mission_offering or 0),
+            float(personal_tithes or 0),
+        )
+
+    cp = ensure_church_progress(mrid)
 
-        srow = db.execute(
+    # Sunday rows, progress and the month flags land in one write transaction.
+    if db.in_transaction:
+        db.commit()
+    cur.execute("BEGIN IMMEDIATE")
+    try:
+        cur.executemany(
             """
-            SELECT id FROM sunday_reports
-            WHERE monthly_report_id = ? AND date = ?
+            INSERT INTO sunday_reports
+            (monthly_report_id, date, y, m, d, is_complete,
+             attendance_adult, attendance_youth, attendance_children,
+             tithes_church, offering, mission, tithes_personal)
+            VALUES (?, ?, ?, ?, ?, 1, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(monthly_report_id, date) DO UPDATE SET
+                is_complete = 1,
+                attendance_adult = excluded.attendance_adult,
+                attendance_youth = excluded.attendance_youth,
+                attendance_children = excluded.attendance_children,
+                tithes_church = excluded.tithes_church,
+                offering = excluded.offering,
+                mission = excluded.mission,
+                tithes_personal = excluded.tithes_personal
             """,
-            (mrid, d.isoformat()),
-        ).fetchone()
-
-        adult = float(r["adult"] or 0)
-        youth = float(r["youth"] or 0)
-        children = float(r["children"] or 0)
-
-        tithes_church = float(r["tithes"] or 0)
-        offering = float(r["offering"] or 0)
-        mission = float(r["mission_offering"] or 0)
-        personal = float(r["personal_tithes"] or 0)
+            list(by_date.values()),
+        )
 
-        if not srow:
-            cur.execute(
-                """
-                INSERT INTO sunday_reports
-                (monthly_report_id, date, is_complete,
-                 attendance_adult, attendance_youth, attendance_children,
-                 tithes_church, offering, mission, tithes_personal)
-                VALUES (?, ?, 1, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    mrid,
-                    d.isoformat(),
-                    adult,
-                    youth,
-                    children,
-                    tithes_church,
-                    offering,
-                    mission,
-                    personal,
-                ),
-            )
-        else:
+        if cp_seed is not None:
             cur.execute(
                 """
-                UPDATE sunday_reports
-                SET is_complete = 1,
-                    attendance_adult = ?,
-                    attendance_youth = ?,
-                    attendance_children = ?,
-                    tithes_church = ?,
-                    offering = ?,
-                    mission = ?,
-                    tithes_personal = ?
+                UPDATE church_progress
+                SET bible_new = ?,
+                    bible_existing = ?,
+                    received_christ = ?,
+                    baptized_water = ?,
+                    baptized_holy_spirit = ?,
+                    healed = ?,
+                    child_dedication = ?,
+                    is_complete = 1
                 WHERE id = ?
                 """,
-                (
-                    adult,
-                    youth,
-                    children,
-                    tithes_church,
-                    offering,
-                    mission,
-                    personal,
-                    srow["id"],
-                ),
+                tuple(int(float(v or 0)) for v in cp_seed) + (cp["id"],),
             )
 
-    cp = ensure_church_progress(mrid)
-    if cp_seed is not None:
+        # A month copied from the cache has always been marked submitted.
         cur.execute(
             """
-            UPDATE church_progress
-            SET bible_new = ?,
-                bible_existing = ?,
-                received_christ = ?,
-                baptized_water = ?,
-                baptized_holy_spirit = ?,
-                healed = ?,
-                child_dedication = ?,
-                is_complete = 1
+            UPDATE monthly_reports
+            SET submitted = 1, approved = ?, cache_digest = ?
             WHERE id = ?
             """,
-            (
-                int(float(cp_seed["new_bible_study"] or 0)),
-                int(float(cp_seed["existing_bible_study"] or 0)),
-                int(float(cp_seed["received_jesus"] or 0)),
-                int(float(cp_seed["water_baptized"] or 0)),
-                int(float(cp_seed["holy_spirit_baptized"] or 0)),
-                int(float(cp_seed["healed"] or 0)),
-                int(float(cp_seed["childrens_dedication"] or 0)),
-                cp["id"],
-            ),
+            (approved, digest, mrid),
         )
 
-    submitted = 1 if any(s.strip() for s in statuses) else 1
-    approved = 0
-    for s in statuses:
-        if "approved" in str(s).lower():
-            approved = 1
-            break
-
-    cur.execute(
-        """
-        UPDATE monthly_reports
-        SET submitted = ?, approved = ?
-        WHERE id = ?
-        """,
-        (submitted, approved, mrid),
-    )
-
-    db.commit()
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
 
 
 # ========================
@@ -2500,7 +2990,19 @@ def get_area_summary_for_month_cache(year: int, month: int, church_items, aopt_a
         )
     return summary
 
-def get_report_stats_for_month_and_church_cache(year: int, month: int, church_key: str):
+# Per-church aggregate columns shared by the single-month and whole-year stats queries.
+REPORT_STATS_AGGREGATES_SQL = """
+    COUNT(*),
+    TOTAL(adult), TOTAL(youth), TOTAL(children),
+    TOTAL(received_jesus), TOTAL(existing_bible_study), TOTAL(new_bible_study),
+    TOTAL(water_baptized), TOTAL(holy_spirit_baptized), TOTAL(childrens_dedication), TOTAL(healed),
+    TOTAL(tithes), TOTAL(offering), TOTAL(personal_tithes), TOTAL(mission_offering), TOTAL(amount_to_send),
+    COUNT(DISTINCT NULLIF(TRIM(status), '')),
+    MAX(NULLIF(TRIM(status), ''))
+"""
+
+
+def _report_stats_from_aggregate(church_key: str, agg):
     stats = {
         "church": church_key,
         "rows": 0,
@@ -2526,11 +3028,58 @@ def get_report_stats_for_month_and_church_cache(year: int, month: int, church_ke
         "sheet_status": "",
     }
 
+    if not agg or not agg[0]:
+        return stats
+
+    (
+        cnt,
+        adult, youth, children,
+        received_jesus, existing_bible_study, new_bible_study,
+        water_baptized, holy_spirit_baptized, childrens_dedication, healed,
+        tithes, offering, personal_tithes, mission_offering, amount_to_send,
+        status_count, status_one,
+    ) = agg
+
+    stats["rows"] = cnt
+    stats["avg"] = {
+        "adult": adult / cnt,
+        "youth": youth / cnt,
+        "children": children / cnt,
+        "received_jesus": received_jesus / cnt,
+        "existing_bible_study": existing_bible_study / cnt,
+        "new_bible_study": new_bible_study / cnt,
+        "water_baptized": water_baptized / cnt,
+        "holy_spirit_baptized": holy_spirit_baptized / cnt,
+        "childrens_dedication": childrens_dedication / cnt,
+        "healed": healed / cnt,
+    }
+    stats["totals"] = {
+        "tithes": tithes,
+        "offering": offering,
+        "personal_tithes": personal_tithes,
+        "mission_offering": mission_offering,
+        "amount_to_send": amount_to_send,
+    }
+
+    if status_count == 1:
+        stats["sheet_status"] = status_one
+    elif status_count > 1:
+        stats["sheet_status"] = "Mixed"
+    else:
+        stats["sheet_status"] = ""
+
+    return stats
+
+
+def get_report_stats_for_month_and_church_cache(year: int, month: int, church_key: str):
     db = get_db()
 
-    rows = db.execute(
-        """
-        SELECT *
+    # Aggregate in SQLite: one result row instead of summing every matching row in Python.
+    cur = db.cursor()
+    cur.row_factory = None
+    agg = cur.execute(
+        f"""
+        SELECT {REPORT_STATS_AGGREGATES_SQL}
         FROM sheet_report_cache
         WHERE year = ? AND month = ?
           AND (
@@ -2538,53 +3087,54 @@ def get_report_stats_for_month_and_church_cache(year: int, month: int, church_ke
           )
         """,
         (year, month, church_key, church_key),
-    ).fetchall()
-
-    if not rows:
-        return stats
+    ).fetchone()
+    return _report_stats_from_aggregate(church_key, agg)
 
-    stats["rows"] = len(rows)
 
-    sum_fields = {k: 0.0 for k in stats["avg"].keys()}
-    totals = {k: 0.0 for k in stats["totals"].keys()}
-    statuses = set()
+def get_report_stats_for_year_cache(year: int, church_keys):
+    """{(church_key, month): stats} for every church/month with cached rows, in one query.
 
-    for r in rows:
-        sum_fields["adult"] += float(r["adult"] or 0)
-        sum_fields["youth"] += float(r["youth"] or 0)
-        sum_fields["children"] += float(r["children"] or 0)
-
-        sum_fields["received_jesus"] += float(r["received_jesus"] or 0)
-        sum_fields["existing_bible_study"] += float(r["existing_bible_study"] or 0)
-        sum_fields["new_bible_study"] += float(r["new_bible_study"] or 0)
-        sum_fields["water_baptized"] += float(r["water_baptized"] or 0)
-        sum_fields["holy_spirit_baptized"] += float(r["holy_spirit_baptized"] or 0)
-        sum_fields["childrens_dedication"] += float(r["childrens_dedication"] or 0)
-        sum_fields["healed"] += float(r["healed"] or 0)
-
-        totals["tithes"] += float(r["tithes"] or 0)
-        totals["offering"] += float(r["offering"] or 0)
-        totals["personal_tithes"] += float(r["personal_tithes"] or 0)
-        totals["mission_offering"] += float(r["mission_offering"] or 0)
-        totals["amount_to_send"] += float(r["amount_to_send"] or 0)
-
-        s = str(r["status"] or "").strip()
-        if s:
-            statuses.add(s)
-
-    for k in stats["avg"].keys():
-        stats["avg"][k] = sum_fields[k] / stats["rows"]
-
-    stats["totals"] = totals
-
-    if len(statuses) == 1:
-        stats["sheet_status"] = list(statuses)[0]
-    elif len(statuses) > 1:
-        stats["sheet_status"] = "Mixed"
-    else:
-        stats["sheet_status"] = ""
+    Same matching as get_report_stats_for_month_and_church_cache (address OR church name),
+    so a row still counts toward every key it matches. Missing pairs mean "no rows".
+    stats["attendance_change"] is the % change in average attendance against the church's
+    previous month with rows (None when there is none or it averaged 0).
+    """
+    church_keys = list(dict.fromkeys(church_keys))
+    if not church_keys:
+        return {}
+
+    cur = get_db().cursor()
+    cur.row_factory = None
+    avg_att_sql = "TOTAL(r.adult) / COUNT(*) + TOTAL(r.youth) / COUNT(*) + TOTAL(r.children) / COUNT(*)"
+    rows = cur.execute(
+        f"""
+        WITH keys(church_key) AS (VALUES {", ".join("(?)" for _ in church_keys)})
+        SELECT
+            CASE WHEN prev_att != 0 THEN (avg_att - prev_att) / prev_att * 100.0 END,
+            grouped.*
+        FROM (
+            SELECT
+                keys.church_key,
+                r.month,
+                {avg_att_sql} AS avg_att,
+                LAG({avg_att_sql}) OVER (PARTITION BY keys.church_key ORDER BY r.month) AS prev_att,
+                {REPORT_STATS_AGGREGATES_SQL}
+            FROM keys
+            JOIN sheet_report_cache AS r
+              ON r.year = ?
+             AND (TRIM(r.address) = TRIM(keys.church_key) OR TRIM(r.church) = TRIM(keys.church_key))
+            GROUP BY keys.church_key, r.month
+        ) AS grouped
+        """,
+        (*church_keys, year),
+    ).fetchall()
 
-    return stats
+    out = {}
+    for attendance_change, church_key, month, _avg_att, _prev_att, *agg in rows:
+        stats = _report_stats_from_aggregate(church_key, agg)
+        stats["attendance_change"] = attendance_change
+        out[(church_key, month)] = stats
+    return out
 
 
 def cache_update_status_for_church_month(year: int, month: int, church_key: str, status_label: str):
@@ -2592,7 +3142,7 @@ def cache_update_status_for_church_month(year: int, month: int, church_key: str,
     db.execute(
         """
         UPDATE sheet_report_cache
-        SET status = ?
+        SET status = ?, row_hash = NULL
         WHERE year = ? AND month = ?
           AND (TRIM(address) = TRIM(?) OR TRIM(church) = TRIM(?))
         """,
@@ -2617,32 +3167,62 @@ def sheet_batch_update_status_for_church_month(year: int, month: int, church_key
     if not sheet_rows:
         return
 
-    client = get_gs_client()
-    sh = client.open("District4 Data")
-    ws = sh.worksheet("Report")
+    ws = _get_ws("Report")
 
-    values = ws.get_all_values()
-    if not values:
-        return
-    headers = values[0]
-    idx_status = _find_col(headers, "status")
+    # Status column index is recorded by every sync; only read the header row if it's unknown.
+    state = db.execute("SELECT report_status_col FROM sync_state WHERE id = 1").fetchone()
+    idx_status = state["report_status_col"] if state else None
+    if idx_status is None:
+        headers = ws.row_values(1)
+        if not headers:
+            return
+        idx_status = _find_col(headers, "status")
     if idx_status is None:
         print("❌ Report sheet missing status header")
         return
 
-    requests_body = []
-    col_letter = chr(ord("A") + idx_status)
-    for r in sheet_rows:
-        a1 = f"{col_letter}{r}"
-        requests_body.append({"range": a1, "values": [[status_label]]})
-
-    ws.batch_update(requests_body)
+    col_letter = _col_letter(idx_status)
+    ws.batch_update(_column_run_ranges(col_letter, sheet_rows, status_label))
 
 
 # ========================
 # Append / Export to sheet
 # ========================
 
+def _delete_sheet_rows(sh, ws, sheet_rows):
+    """
+    Deletes the given 1-based rows of ws with one spreadsheet batchUpdate.
+    Contiguous rows collapse into one deleteDimension range; ranges run bottom to top
+    so earlier deletions don't shift the rows still to be deleted.
+    """
+    runs = []
+    for r in sorted(set(sheet_rows), reverse=True):
+        if runs and runs[-1][0] == r + 1:
+            runs[-1][0] = r
+        else:
+            runs.append([r, r])
+    if not runs:
+        return
+
+    sh.batch_update(
+        {
+            "requests": [
+                {
+                    "deleteDimension": {
+                        "range": {
+                            "sheetId": ws.id,
+                            "dimension": "ROWS",
+                            "startIndex": start - 1,
+                            "endIndex": end,
+                        }
+                    }
+                }
+                for start, end in runs
+            ]
+        }
+    )
+
+
 def _delete_report_rows_for_month_in_sheet(year: int, month: int, church_key: str, pastor_name: str):
     """
     Deletes existing rows in Google Sheets 'Report' that match:
@@ -2672,36 +3252,15 @@ def _delete_report_rows_for_month_in_sheet(year: int, month: int, church_key: st
     if not sheet_rows:
         return
 
-    client = get_gs_client()
-    sh = client.open("District4 Data")
-    ws = sh.worksheet("Report")
+    sh = open_district_sheet()
+    ws = _get_ws("Report")
 
-    # Delete from bottom to top so row numbers stay correct
-    for r in sheet_rows:
-        if r > 1:  # never delete header row
-            ws.delete_rows(r)
+    _delete_sheet_rows(sh, ws, [r for r in sheet_rows if r > 1])  # never delete header row
 
 
 def _ensure_accounts_headers(ws):
-    values = ws.get_all_values()
     headers = ["Name", "Area Number", "Church ID", "Church Address", "Contact #", "Birth Day", "UserName", "Password", "Position", "Sub Area", "GooglePinLocation"]
-    if not values:
-        ws.append_row(headers, value_input_option="USER_ENTERED")
-        return headers
-    current = list(values[0])
-    changed = False
-    for i, name in enumerate(headers):
-        if _find_col(current, name) is None:
-            while len(current) <= i:
-                current.append("")
-            current[i] = name
-            changed = True
-    if changed:
-        rng = f"A1:{chr(ord('A') + len(current) - 1)}1"
-        ws.update(rng, [current], value_input_option="USER_ENTERED")
-        values = ws.get_all_values()
-        return values[0]
-    return current
+    return _ensure_header_row(ws, headers)
 
 
 def _build_account_row_from_headers(headers, payload: dict):
@@ -2727,27 +3286,142 @@ def _build_account_row_from_headers(headers, payload: dict):
             row[i] = mapping[h]
     return row
 
-def append_account_to_sheet(pastor_data: dict):
-    client = get_gs_client()
-    sh = client.open("District4 Data")
+def append_account_to_sheet(pastor_data: dict):
+    worksheet = _get_ws("Accounts", create=True, rows=100, cols=12)
+
+    # Ensure headers exist and start at Column A
+    headers = _ensure_accounts_headers(worksheet)
+
+    # Build row aligned with headers
+    row = _build_account_row_from_headers(headers, pastor_data)
+
+    # ✅ FORCE WRITE FROM COLUMN A (FIX)
+    worksheet.append_rows(
+        [row],
+        value_input_option="USER_ENTERED",
+        table_range="A1"   # 🔥 THIS IS THE FIX
+    )
+
+
+def _account_on_sheet(pastor_data: dict):
+    """True when the Accounts tab already has pastor_data's username (an append that landed)."""
+    ws = _get_ws("Accounts")
+    i_user = _find_col(_header_row(ws), "UserName")
+    if i_user is None:
+        return False
+    username = str(pastor_data.get("username") or "").strip()
+    return any(str(v).strip() == username for v in ws.col_values(i_user + 1)[1:])
+
+
+# ========================
+# Background Sheets writes
+# ========================
+# Sheets round-trips (~0.3-0.8s each) are handed to a daemon worker so the
+# request can answer from the local DB straight away.
+
+SHEETS_WRITE_RETRIES = 3
+_SHEETS_QUEUE = queue.Queue()
+_SHEETS_WORKER = None
+_SHEETS_WORKER_LOCK = threading.Lock()
+
+
+def _record_sheets_write_failure(op: str, payload, error):
+    db = get_db()
+    db.execute(
+        """
+        INSERT INTO sheets_write_failures (created_at, op, payload, error_message)
+        VALUES (?, ?, ?, ?)
+        """,
+        (utc_now_iso(), op, json.dumps(payload, default=str), repr(error)),
+    )
+    db.commit()
+
+
+# Ops whose enqueuer already applied the change to these cache tabs.
+_OPTIMISTIC_OP_TABS = {
+    "append_account": {"Accounts"},
+    "prayer_cells": {"PrayerRequest"},
+}
+
+
+def _sheets_worker():
+    ops = {
+        "append_account": append_account_to_sheet,
+        # sheet_row is looked up when the job runs, so earlier row deletes are accounted for.
+        "prayer_cells": lambda payload: _update_prayer_request_cells_in_sheet(
+            payload["request_id"], payload["updates"]
+        ),
+    }
+    # A timed-out append may still have landed: check before sending it again.
+    already_written = {
+        "append_account": _account_on_sheet,
+    }
+    while True:
+        op, payload = _SHEETS_QUEUE.get()
+        try:
+            error = None
+            for attempt in range(SHEETS_WRITE_RETRIES):
+                try:
+                    with app.app_context():
+                        if attempt and op in already_written and already_written[op](payload):
+                            break
+                        ops[op](payload)
+                    break
+                except Exception as e:
+                    error = e
+                    print(f"❌ Background Sheets write failed ({op}, attempt {attempt + 1}):", e)
+                    time.sleep(2 ** attempt)
+            else:
+                # Out of retries: keep the job so it can be found and replayed, and reload
+                # the tabs it edited optimistically so the cache matches the sheet again.
+                with app.app_context():
+                    _record_sheets_write_failure(op, payload, error)
+                    if op in _OPTIMISTIC_OP_TABS:
+                        sync_from_sheets_if_needed(force=True, only=_OPTIMISTIC_OP_TABS[op])
+                continue
+
+            # A burst of queued writes shares one refresh: the last job in the queue runs it.
+            if _SHEETS_QUEUE.qsize():
+                continue
+
+            # Pull the new row (and its sheet_row) back into the cache.
+            with app.app_context():
+                sync_from_sheets_if_needed(force=True)
+        except Exception as e:
+            print(f"❌ Background Sheets worker error ({op}):", e)
+        finally:
+            _count_pending_write(op, -1)
+            _SHEETS_QUEUE.task_done()
+
 
-    try:
-        worksheet = sh.worksheet("Accounts")
-    except gspread.WorksheetNotFound:
-        worksheet = sh.add_worksheet(title="Accounts", rows=100, cols=12)
+def enqueue_sheets_write(op: str, payload):
+    global _SHEETS_WORKER
+    with _SHEETS_WORKER_LOCK:
+        if _SHEETS_WORKER is None or not _SHEETS_WORKER.is_alive():
+            _SHEETS_WORKER = threading.Thread(target=_sheets_worker, name="sheets-writer", daemon=True)
+            _SHEETS_WORKER.start()
+    _count_pending_write(op, 1)
+    _SHEETS_QUEUE.put((op, payload))
 
-    # Ensure headers exist and start at Column A
-    headers = _ensure_accounts_headers(worksheet)
 
-    # Build row aligned with headers
-    row = _build_account_row_from_headers(headers, pastor_data)
+def queue_prayer_request_update(request_id, updates: dict):
+    """
+    Apply prayer cell edits to the local cache now and write them to the sheet on the
+    worker thread (which re-syncs afterwards), so the request never waits on Sheets.
+    updates keys are the _update_prayer_request_cells_in_sheet ones (cache column names).
+    """
+    updates = {k: v for k, v in updates.items() if k in _PRAYER_FIELD_COL}
+    if not updates:
+        return False
 
-    # ✅ FORCE WRITE FROM COLUMN A (FIX)
-    worksheet.append_rows(
-        [row],
-        value_input_option="USER_ENTERED",
-        table_range="A1"   # 🔥 THIS IS THE FIX
+    db = get_db()
+    db.execute(
+        f"UPDATE sheet_prayer_request_cache SET {', '.join(f'{k} = ?' for k in updates)} WHERE request_id = ?",
+        (*updates.values(), request_id),
     )
+    db.commit()
+    enqueue_sheets_write("prayer_cells", {"request_id": request_id, "updates": updates})
+    return True
 
 
 def _ensure_report_sheet_headers(ws):
@@ -2755,9 +3429,8 @@ def _ensure_report_sheet_headers(ws):
     Ensures the Report sheet has a header row.
     If headers already exist, it does nothing.
     """
-    values = ws.get_all_values()
-    if values:
-        return values
+    if _header_row(ws):
+        return
 
     headers = [
         "church",
@@ -2782,45 +3455,47 @@ def _ensure_report_sheet_headers(ws):
         "status",
     ]
     ws.append_row(headers)
-    return ws.get_all_values()
+    _invalidate_headers(ws, headers)
 
 
-def append_report_to_sheet(report_data: dict):
-    client = get_gs_client()
-    sh = client.open("District4 Data")
+def append_report_to_sheet(report_data):
+    """Appends one report row (dict) or several (list of dicts) in a single append_rows call."""
+    items = [report_data] if isinstance(report_data, dict) else list(report_data)
+    if not items:
+        return
 
-    try:
-        ws = sh.worksheet("Report")
-    except gspread.WorksheetNotFound:
-        ws = sh.add_worksheet(title="Report", rows=1000, cols=25)
+    ws = _get_ws("Report", create=True, rows=1000, cols=25)
 
     _ensure_report_sheet_headers(ws)
 
-    row = [
-        report_data.get("church", ""),
-        report_data.get("pastor", ""),
-        report_data.get("address", ""),
-        report_data.get("adult", ""),
-        report_data.get("youth", ""),
-        report_data.get("children", ""),
-        report_data.get("tithes", ""),
-        report_data.get("offering", ""),
-        report_data.get("personal_tithes", ""),
-        report_data.get("mission_offering", ""),
-        report_data.get("received_jesus", ""),
-        report_data.get("existing_bible_study", ""),
-        report_data.get("new_bible_study", ""),
-        report_data.get("water_baptized", ""),
-        report_data.get("holy_spirit_baptized", ""),
-        report_data.get("childrens_dedication", ""),
-        report_data.get("healed", ""),
-        report_data.get("activity_date", ""),
-        report_data.get("amount_to_send", ""),
-        report_data.get("status", ""),
+    rows = [
+        [
+            item.get("church", ""),
+            item.get("pastor", ""),
+            item.get("address", ""),
+            item.get("adult", ""),
+            item.get("youth", ""),
+            item.get("children", ""),
+            item.get("tithes", ""),
+            item.get("offering", ""),
+            item.get("personal_tithes", ""),
+            item.get("mission_offering", ""),
+            item.get("received_jesus", ""),
+            item.get("existing_bible_study", ""),
+            item.get("new_bible_study", ""),
+            item.get("water_baptized", ""),
+            item.get("holy_spirit_baptized", ""),
+            item.get("childrens_dedication", ""),
+            item.get("healed", ""),
+            item.get("activity_date", ""),
+            item.get("amount_to_send", ""),
+            item.get("status", ""),
+        ]
+        for item in items
     ]
 
     # ✅ Force writing starting at column A by using a fixed range "A:..."
-    ws.append_rows([row], value_input_option="USER_ENTERED", table_range="A1")
+    ws.append_rows(rows, value_input_option="USER_ENTERED", table_range="A1")
 
 
 
@@ -2876,11 +3551,10 @@ def export_month_to_sheet(year: int, month: int, status_label: str):
     church_key = church_id or church_address
     _delete_report_rows_for_month_in_sheet(year, month, church_key, pastor_name)
 
+    report_items = []
     for row in sunday_rows:
-        d = datetime.fromisoformat(row["date"]).date()
-
         # ✅ IMPORTANT: keep date like 12/21/2025 (NOT =DATE(...))
-        activity_date = f"{d.month}/{d.day}/{d.year}"
+        activity_date = sunday_sheet_date(row)
 
 
         tithes_church = row["tithes_church"] or 0
@@ -2911,12 +3585,14 @@ def export_month_to_sheet(year: int, month: int, status_label: str):
             "amount_to_send": amount_to_send,
             "status": status_label,
         }
+        report_items.append(report_data)
 
-        try:
-            append_report_to_sheet(report_data)
-        except Exception as e:
-            print("❌ Pastor export failed:", repr(e))
-            traceback.print_exc()
+    # One append_rows call for the whole month instead of one per Sunday.
+    try:
+        append_report_to_sheet(report_items)
+    except Exception as e:
+        print("❌ Pastor export failed:", repr(e))
+        traceback.print_exc()
 
 
 # ========================
@@ -2925,37 +3601,61 @@ def export_month_to_sheet(year: int, month: int, status_label: str):
 
 PRAYER_SHEET_NAME = "PrayerRequest"
 
+# Header row written by _ensure_prayer_sheet_headers (A..I).
+PRAYER_SHEET_HEADERS = [
+    "Church Name",
+    "Submitted By",
+    "Request ID",
+    "Prayer Request Title",
+    "Prayer Request Date",
+    "Prayer Request",
+    "Status",
+    "Pastor's Praying",
+    "Answered Date",
+]
+
+# update key -> PrayerRequest header
+PRAYER_FIELD_HEADERS = {
+    "church_name": "Church Name",
+    "submitted_by": "Submitted By",
+    "request_id": "Request ID",
+    "title": "Prayer Request Title",
+    "request_date": "Prayer Request Date",
+    "request_text": "Prayer Request",
+    "status": "Status",
+    "pastors_praying": "Pastor's Praying",
+    "answered_date": "Answered Date",
+}
+
+# The layout is fixed, so cell edits address columns directly without reading row 1.
+# Built from PRAYER_SHEET_HEADERS: a renamed header fails here at import, not mid-edit.
+_PRAYER_FIELD_COL = {
+    field: _col_letter(PRAYER_SHEET_HEADERS.index(header))
+    for field, header in PRAYER_FIELD_HEADERS.items()
+}
+
+
+PRAYER_HEADER_RANGE = f"A1:{_col_letter(len(PRAYER_SHEET_HEADERS) - 1)}1"
+_PRAYER_HEADERS_ENSURED = False
+
 
 def _ensure_prayer_sheet_headers(ws):
     """
     Ensures header row exists (doesn't overwrite if already there).
+    Reads only the header range, and only until it has been seen once in this process.
     """
-    values = ws.get_all_values()
-    if values:
-        return values
+    global _PRAYER_HEADERS_ENSURED
+    if _PRAYER_HEADERS_ENSURED:
+        return
 
-    headers = [
-        "Church Name",
-        "Submitted By",
-        "Request ID",
-        "Prayer Request Title",
-        "Prayer Request Date",
-        "Prayer Request",
-        "Status",
-        "Pastor's Praying",
-        "Answered Date",
-    ]
-    ws.append_row(headers)
-    return ws.get_all_values()
+    top = ws.get(PRAYER_HEADER_RANGE)
+    if not (top and any(str(v).strip() for v in top[0])):
+        ws.update(PRAYER_HEADER_RANGE, [PRAYER_SHEET_HEADERS])
+    _PRAYER_HEADERS_ENSURED = True
 
 
 def _append_prayer_request_to_sheet(church_name, submitted_by, request_id, title, request_date, request_text):
-    client = get_gs_client()
-    sh = client.open("District4 Data")
-    try:
-        ws = sh.worksheet(PRAYER_SHEET_NAME)
-    except gspread.WorksheetNotFound:
-        ws = sh.add_worksheet(title=PRAYER_SHEET_NAME, rows=1000, cols=12)
+    ws = _get_ws(PRAYER_SHEET_NAME, create=True)
 
     _ensure_prayer_sheet_headers(ws)
     ws.append_row(
@@ -2988,45 +3688,36 @@ def _update_prayer_request_cells_in_sheet(request_id, updates: dict):
 
     sheet_row = int(cached["sheet_row"])
 
-    client = get_gs_client()
-    sh = client.open("District4 Data")
-    ws = sh.worksheet(PRAYER_SHEET_NAME)
-
-    values = ws.get_all_values()
-    if not values:
-        return False
-    headers = values[0]
-
-    col_map = {
-        "church_name": "Church Name",
-        "submitted_by": "Submitted By",
-        "request_id": "Request ID",
-        "title": "Prayer Request Title",
-        "request_date": "Prayer Request Date",
-        "request_text": "Prayer Request",
-        "status": "Status",
-        "pastors_praying": "Pastor's Praying",
-        "answered_date": "Answered Date",
-    }
-
     body = []
     for k, v in updates.items():
-        header = col_map.get(k)
-        if not header:
+        col_letter = _PRAYER_FIELD_COL.get(k)
+        if not col_letter:
             continue
-        idx = _find_col(headers, header)
-        if idx is None:
-            continue
-        col_letter = chr(ord("A") + idx)
         body.append({"range": f"{col_letter}{sheet_row}", "values": [[v]]})
 
     if not body:
         return False
 
-    ws.batch_update(body)
+    _get_ws(PRAYER_SHEET_NAME).batch_update(body)
     return True
 
 
+def _update_prayer_request_statuses_in_sheet(sheet_rows: dict, status: str):
+    """
+    Set the status cell of several requests with one batch_update.
+    sheet_rows: {request_id: sheet_row}, taken from cache rows the caller already loaded.
+    """
+    col_letter = _PRAYER_FIELD_COL["status"]
+    body = [
+        {"range": f"{col_letter}{int(sheet_row)}", "values": [[status]]}
+        for sheet_row in sheet_rows.values()
+        if sheet_row
+    ]
+    if body:
+        _get_ws(PRAYER_SHEET_NAME).batch_update(body)
+    return len(body)
+
+
 def _delete_prayer_request_row_in_sheet(request_id):
     db = get_db()
     cached = db.execute(
@@ -3040,11 +3731,17 @@ def _delete_prayer_request_row_in_sheet(request_id):
     if sheet_row <= 1:
         return False
 
-    client = get_gs_client()
-    sh = client.open("District4 Data")
-    ws = sh.worksheet(PRAYER_SHEET_NAME)
+    ws = _get_ws(PRAYER_SHEET_NAME)
 
     ws.delete_rows(sheet_row)
+
+    # Mirror the delete locally (rows below move up one) instead of re-reading the tab.
+    db.execute("DELETE FROM sheet_prayer_request_cache WHERE request_id = ?", (request_id,))
+    db.execute(
+        "UPDATE sheet_prayer_request_cache SET sheet_row = sheet_row - 1 WHERE sheet_row > ?",
+        (sheet_row,),
+    )
+    db.commit()
     return True
 
 
@@ -3052,66 +3749,78 @@ def _delete_prayer_request_row_in_sheet(request_id):
 # Prayer Request cache queries
 # ========================
 
+# Hot queries live in module constants: every call hands sqlite3 the same str object,
+# so the connection's statement cache reuses the prepared statement.
+# Display-ready columns: blanks instead of NULLs and a default status, so pages can hand the
+# rows straight to their templates. Filters/ordering use p.<column> (the raw cached value).
+PRAYER_DISPLAY_COLUMNS = """
+    p.request_id,
+    COALESCE(p.church_name, '') AS church_name,
+    COALESCE(p.submitted_by, '') AS submitted_by,
+    COALESCE(p.title, '') AS title,
+    COALESCE(p.request_date, '') AS request_date,
+    COALESCE(p.request_text, '') AS request_text,
+    COALESCE(NULLIF(p.status, ''), 'Pending') AS status,
+    COALESCE(p.pastors_praying, '') AS pastors_praying,
+    COALESCE(p.answered_date, '') AS answered_date,
+    p.sheet_row
+"""
+
+PRAYER_FOR_USER_SQL = f"""
+    SELECT {PRAYER_DISPLAY_COLUMNS}
+    FROM sheet_prayer_request_cache AS p
+    WHERE TRIM(p.submitted_by) = TRIM(?)
+    ORDER BY p.request_date DESC, p.sheet_row DESC
+"""
+
+PRAYER_OPEN_FOR_USER_SQL = f"""
+    SELECT {PRAYER_DISPLAY_COLUMNS}
+    FROM sheet_prayer_request_cache AS p
+    WHERE TRIM(p.submitted_by) = TRIM(?)
+      AND (p.status IS NULL OR TRIM(p.status) != 'Answered')
+    ORDER BY p.request_date DESC, p.sheet_row DESC
+"""
+
+PRAYER_ANSWERED_FOR_USER_SQL = f"""
+    SELECT {PRAYER_DISPLAY_COLUMNS}
+    FROM sheet_prayer_request_cache AS p
+    WHERE TRIM(p.submitted_by) = TRIM(?)
+      AND TRIM(p.status) = 'Answered'
+    ORDER BY p.answered_date DESC, p.request_date DESC, p.sheet_row DESC
+"""
+
+PRAYER_PENDING_SQL = f"""
+    SELECT {PRAYER_DISPLAY_COLUMNS}
+    FROM sheet_prayer_request_cache AS p
+    WHERE TRIM(p.status) = 'Pending'
+    ORDER BY p.request_date DESC, p.sheet_row DESC
+"""
+
+CHURCH_AREA_SQL = (
+    "SELECT age FROM sheet_accounts_cache WHERE TRIM(sex)=TRIM(?) OR TRIM(church_address)=TRIM(?) LIMIT 1"
+)
+
 def get_prayer_requests_for_user(submitted_by: str, include_answered=False):
     db = get_db()
-    if include_answered:
-        rows = db.execute(
-            """
-            SELECT *
-            FROM sheet_prayer_request_cache
-            WHERE TRIM(submitted_by) = TRIM(?)
-            ORDER BY request_date DESC, sheet_row DESC
-            """,
-            (submitted_by,),
-        ).fetchall()
-    else:
-        rows = db.execute(
-            """
-            SELECT *
-            FROM sheet_prayer_request_cache
-            WHERE TRIM(submitted_by) = TRIM(?)
-              AND (status IS NULL OR TRIM(status) != 'Answered')
-            ORDER BY request_date DESC, sheet_row DESC
-            """,
-            (submitted_by,),
-        ).fetchall()
-    return rows
+    sql = PRAYER_FOR_USER_SQL if include_answered else PRAYER_OPEN_FOR_USER_SQL
+    return db.execute(sql, (submitted_by,)).fetchall()
 
 
 def get_answered_prayer_requests_for_user(submitted_by: str):
     db = get_db()
-    return db.execute(
-        """
-        SELECT *
-        FROM sheet_prayer_request_cache
-        WHERE TRIM(submitted_by) = TRIM(?)
-          AND TRIM(status) = 'Answered'
-        ORDER BY answered_date DESC, request_date DESC, sheet_row DESC
-        """,
-        (submitted_by,),
-    ).fetchall()
+    return db.execute(PRAYER_ANSWERED_FOR_USER_SQL, (submitted_by,)).fetchall()
 
 
 def get_pending_prayers_for_ao():
     db = get_db()
-    rows = db.execute(
-        """
-        SELECT *
-        FROM sheet_prayer_request_cache
-        WHERE TRIM(status) = 'Pending'
-        ORDER BY request_date DESC, sheet_row DESC
-        """
-    ).fetchall()
+    rows = db.execute(PRAYER_PENDING_SQL).fetchall()
     if not ao_logged_in():
         return rows
     area = str(session.get("ao_area_number") or "").strip()
     filtered = []
     for r in rows:
         church_name = str(r["church_name"] or "").strip()
-        row = db.execute(
-            "SELECT age FROM sheet_accounts_cache WHERE TRIM(sex)=TRIM(?) OR TRIM(church_address)=TRIM(?) LIMIT 1",
-            (church_name, church_name),
-        ).fetchone()
+        row = db.execute(CHURCH_AREA_SQL, (church_name, church_name)).fetchone()
         if row and str(row["age"] or "").strip() == area:
             filtered.append(r)
     return filtered
@@ -3121,7 +3830,7 @@ def get_pending_prayers_for_ao():
 # Bible verse of the day
 # ========================
 
-VERSE_REFERENCES = [
+VERSE_REFERENCES = (
     # Holy Living (1–52)
     "Leviticus 20:7",
     "Psalm 24:3-4",
@@ -3497,27 +4206,78 @@ VERSE_REFERENCES = [
     "Jeremiah 20:11",
     "John 16:33",
     "Romans 15:5"
-]
+)
+
+
+
+VERSE_FOR_DATE_SQL = "SELECT * FROM verses WHERE date = ?"
+
+# Today's (reference, text), keyed by date ordinal; the verses table stays the durable copy.
+_VOTD_CACHE = {}
 
+# Keep-alive connection to bible-api.com, reused across fetches.
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=2))
+
+# Fetch the new day's verse shortly after midnight (server time), so the first
+# visitor of the day doesn't wait on bible-api.com.
+VOTD_PREFETCH_DELAY_SECONDS = 5 * 60
+_VOTD_TIMER = None
+_VOTD_TIMER_LOCK = threading.Lock()
+
+
+def _seconds_until_votd_prefetch():
+    now = datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return (midnight - now).total_seconds() + VOTD_PREFETCH_DELAY_SECONDS
+
+
+def _prefetch_votd():
+    try:
+        with app.app_context():
+            get_verse_of_the_day()
+    except Exception as e:
+        print("❌ Verse of the day prefetch failed:", e)
+    finally:
+        _schedule_votd_prefetch(reschedule=True)
+
+
+def _schedule_votd_prefetch(reschedule=False):
+    global _VOTD_TIMER
+    with _VOTD_TIMER_LOCK:
+        if _VOTD_TIMER is not None and not reschedule:
+            return
+        _VOTD_TIMER = threading.Timer(_seconds_until_votd_prefetch(), _prefetch_votd)
+        _VOTD_TIMER.daemon = True
+        _VOTD_TIMER.start()
 
 
 def get_verse_of_the_day():
-    today_str = date.today().isoformat()
+    _schedule_votd_prefetch()
+
+    key = date.today().toordinal()
+    cached = _VOTD_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    today_str = date.fromordinal(key).isoformat()
     db = get_db()
     cursor = db.cursor()
 
-    cursor.execute("SELECT * FROM verses WHERE date = ?", (today_str,))
+    cursor.execute(VERSE_FOR_DATE_SQL, (today_str,))
     row = cursor.fetchone()
     if row:
-        return row["reference"], row["text"]
+        _VOTD_CACHE.clear()
+        _VOTD_CACHE[key] = (row["reference"], row["text"])
+        return _VOTD_CACHE[key]
 
-    idx = date.today().toordinal() % len(VERSE_REFERENCES)
+    idx = key % len(VERSE_REFERENCES)
     reference = VERSE_REFERENCES[idx]
 
     verse_text = reference
     try:
         encoded_ref = urllib.parse.quote(reference)
-        resp = requests.get(f"https://bible-api.com/{encoded_ref}", timeout=5)
+        resp = _HTTP.get(f"https://bible-api.com/{encoded_ref}", timeout=5)
         resp.raise_for_status()
         data = resp.json()
         if "text" in data and data["text"].strip():
@@ -3534,6 +4294,8 @@ def get_verse_of_the_day():
     )
     db.commit()
 
+    _VOTD_CACHE.clear()
+    _VOTD_CACHE[key] = (reference, verse_text)
     return reference, verse_text
 
 
@@ -3542,6 +4304,15 @@ def get_verse_of_the_day():
 # ========================
 
 
+def _form(name: str) -> str:
+    return (request.form.get(name) or "").strip()
+
+
+def _secret_matches(stored, given: str) -> bool:
+    # Constant-time compare; encode so non-ASCII passwords don't raise.
+    return hmac.compare_digest(str(stored or "").strip().encode("utf-8"), (given or "").encode("utf-8"))
+
+
 def ao_logged_in():
     return session.get("ao_logged_in") is True
 
@@ -3801,16 +4572,39 @@ def _record_pastor_login_event(row):
     get_db().commit()
 
 
+# Schema setup/migrations run on the first request of each process, not on every request.
+_DB_INITIALIZED = False
+_DB_INIT_LOCK = threading.Lock()
+
+
+def _init_db_once():
+    global _DB_INITIALIZED
+    if _DB_INITIALIZED:
+        return
+    with _DB_INIT_LOCK:
+        if _DB_INITIALIZED:
+            return
+        init_db()
+        _DB_INITIALIZED = True
+
+
 @app.before_request
 def before_request():
-    init_db()
+    _init_db_once()
     _log_visit_if_needed()
 
 
 @app.teardown_appcontext
 def close_connection(exception):
     db = getattr(g, "_database", None)
-    if db is not None:
+    if db is None:
+        return
+    try:
+        # Never hand a half-finished transaction to the next request.
+        if db.in_transaction:
+            db.rollback()
+        _DB_POOL.put_nowait((g._database_path, db))
+    except Exception:
         db.close()
 
 
@@ -3826,24 +4620,17 @@ def splash():
         return redirect(url_for("bulletin"))
 
     if request.method == "POST":
-        username = (request.form.get("username") or "").strip()
-        password = (request.form.get("password") or "").strip()
+        username = _form("username")
+        password = _form("password")
 
         if not username or not password:
             error = "Username and password are required."
         else:
             # Force refresh on login so role/password changes in Accounts are honored.
-            sync_from_sheets_if_needed(force=True)
-            row = get_db().execute(
-                """
-                SELECT username, password, name, church_address, sex, age, position, sub_area, contact, birthday
-                FROM sheet_accounts_cache
-                WHERE TRIM(username) = TRIM(?)
-                """,
-                (username,),
-            ).fetchone()
+            sync_from_sheets_if_needed(force=True, max_age=FORCED_SYNC_TTL_SECONDS)
+            row = _lookup_account(username)
 
-            if row and str(row["password"] or "").strip() == password:
+            if row and _secret_matches(row["password"], password):
                 session.clear()
                 session.permanent = True
 
@@ -4041,16 +4828,11 @@ def _normalize_key(value):
 
 
 def _current_user_area_number():
-    db = get_db()
-
     if pastor_logged_in():
         username = (session.get("pastor_username") or "").strip()
         if not username:
             return ""
-        row = db.execute(
-            "SELECT age FROM sheet_accounts_cache WHERE username = ?",
-            (username,),
-        ).fetchone()
+        row = _lookup_account(username)
         return str(row["age"] or "").strip() if row else ""
 
     if ao_logged_in():
@@ -4455,7 +5237,7 @@ def bulletin_pray(request_id):
     if not any_user_logged_in():
         return redirect(url_for("pastor_login", next=request.path))
 
-    sync_from_sheets_if_needed(force=True)
+    sync_from_sheets_if_needed(force=True, max_age=FORCED_SYNC_TTL_SECONDS)
 
     area_number = _current_user_area_number()
     if not area_number:
@@ -4503,11 +5285,10 @@ def bulletin_pray(request_id):
     current_key = _normalize_key(current_church)
     if current_key not in normalized_existing:
         cleaned_existing.append(current_church)
-        _update_prayer_request_cells_in_sheet(
+        queue_prayer_request_update(
             request_id,
             {"pastors_praying": ", ".join(cleaned_existing)},
         )
-        sync_from_sheets_if_needed(force=True)
 
     return redirect(url_for("bulletin"))
 
@@ -4518,21 +5299,17 @@ def bulletin_pray(request_id):
 @app.route("/pastor-login", methods=["GET", "POST"])
 def pastor_login():
     error = None
-    next_url = request.args.get("next") or url_for("bulletin")
 
     if request.method == "POST":
-        username = (request.form.get("username") or "").strip()
-        password = (request.form.get("password") or "").strip()
+        username = _form("username")
+        password = _form("password")
 
         if not username or not password:
             error = "Username and password are required."
         else:
-            row = get_db().execute(
-                "SELECT username, password, name, church_address, sex, age, position, sub_area FROM sheet_accounts_cache WHERE username = ?",
-                (username,),
-            ).fetchone()
+            row = _lookup_account(username)
 
-            if row and str(row["password"] or "").strip() == password:
+            if row and _secret_matches(row["password"], password):
                 session["pastor_logged_in"] = True
                 session["pastor_username"] = username
                 session["pastor_name"] = row["name"] or ""
@@ -4540,21 +5317,24 @@ def pastor_login():
                 session["pastor_church_id"] = (row["sex"] or "").strip()
                 session["pastor_area_number"] = (row["age"] or "").strip() if "age" in row.keys() else ""
                 session["selected_position"] = "pastor"
-                session.permanent = True
+                if not session.permanent:
+                    session.permanent = True
                 _record_pastor_login_event(row)
                 return redirect(url_for("bulletin"))
 
             try:
-                client = get_gs_client()
-                sh = client.open("District4 Data")
-                ws = sh.worksheet("Accounts")
-                records = ws.get_all_records()
+                # One read of the tab; findall() would download it too, and only matches exact
+                # cells, while UserName cells can carry stray whitespace.
+                values = _get_ws("Accounts").get_all_values()
+                headers = values[0] if values else []
+                i_user = _find_col(headers, "UserName")
 
                 matched = None
-                for rec in records:
-                    u = str(rec.get("UserName", "")).strip()
-                    p = str(rec.get("Password", "")).strip()
-                    if username == u and password == p:
+                for row in values[1:] if i_user is not None else []:
+                    if i_user >= len(row) or row[i_user].strip() != username:
+                        continue
+                    rec = dict(zip(headers, row + [""] * (len(headers) - len(row))))
+                    if _secret_matches(rec.get("Password", ""), password):
                         matched = rec
                         break
 
@@ -4566,7 +5346,8 @@ def pastor_login():
                     session["pastor_church_id"] = matched.get("Church ID", "") or matched.get("Sex", "")
                     session["pastor_area_number"] = str(matched.get("Area Number", "") or matched.get("Age", "")).strip()
                     session["selected_position"] = "pastor"
-                    session.permanent = True
+                    if not session.permanent:
+                        session.permanent = True
 
                     login_event_row = {
                         "username": username,
@@ -4579,13 +5360,15 @@ def pastor_login():
                     }
                     _record_pastor_login_event(login_event_row)
 
-                    sync_from_sheets_if_needed(force=True)
+                    # Only the Accounts cache missed this pastor; leave the other tabs on their interval.
+                    sync_from_sheets_if_needed(force=True, only={"Accounts"})
                     return redirect(url_for("bulletin"))
 
                 error = "Invalid username or password."
             except Exception as e:
                 error = f"Error accessing Google Sheets: {e}"
 
+    next_url = request.args.get("next") or url_for("bulletin")
     return render_template("pastor_login.html", error=error, next_url=next_url)
 
 
@@ -4678,9 +5461,9 @@ def _export_month_to_sheet_for_pastor(pastor_username: str, year: int, month: in
     church_key = church_id or church_address
     _delete_report_rows_for_month_in_sheet(year, month, church_key, pastor_name)
 
+    report_items = []
     for row in sunday_rows:
-        d = datetime.fromisoformat(row["date"]).date()
-        activity_date = f"{d.month}/{d.day}/{d.year}"
+        activity_date = sunday_sheet_date(row)
 
         tithes_church = row["tithes_church"] or 0
         offering = row["offering"] or 0
@@ -4710,8 +5493,9 @@ def _export_month_to_sheet_for_pastor(pastor_username: str, year: int, month: in
             "amount_to_send": amount_to_send,
             "status": status_label,
         }
-        append_report_to_sheet(report_data)
+        report_items.append(report_data)
 
+    append_report_to_sheet(report_items)
     return True
 
 
@@ -4982,41 +5766,21 @@ def pastor_tool():
             }
         )
 
-    db = get_db()
-    cursor = db.cursor()
-    cursor.execute(
-        """
-        SELECT
-            SUM(
-                COALESCE(tithes_church, 0) +
-                COALESCE(offering, 0) +
-                COALESCE(mission, 0) +
-                COALESCE(tithes_personal, 0)
-            ) AS total_amount
-        FROM sunday_reports
-        WHERE monthly_report_id = ?
-          AND is_complete = 1
-        """,
-        (monthly_report["id"],),
-    )
-    row = cursor.fetchone()
-    monthly_total = row["total_amount"] or 0.0
+    # Total and completeness come from the Sunday rows already loaded above (no extra queries).
+    monthly_total = sum(
+        (row["tithes_church"] or 0) + (row["offering"] or 0) + (row["mission"] or 0) + (row["tithes_personal"] or 0)
+        for row in sunday_rows
+        if row["is_complete"] == 1
+    ) or 0.0
 
     year_options = list(range(today.year - 10, today.year + 4))
 
-    month_names = [
-        ("January", 1), ("February", 2), ("March", 3), ("April", 4),
-        ("May", 5), ("June", 6), ("July", 7), ("August", 8),
-        ("September", 9), ("October", 10), ("November", 11), ("December", 12),
-    ]
-
-    sundays_ok = all_sundays_complete(monthly_report["id"])
+    sundays_ok = bool(sunday_rows) and all(row["is_complete"] for row in sunday_rows)
     can_submit = sundays_ok and cp_complete
     status_key = get_month_status(monthly_report)
 
     # ✅ Build checkmarks based on Google Sheets cache (not local DB)
     db = get_db()
-    cursor = db.cursor()
 
     refresh_pastor_from_cache()
     pastor_name = (session.get("pastor_name") or "").strip()
@@ -5058,8 +5822,9 @@ def pastor_tool():
                     set_month_submitted(year, month, pastor_username)
                     _export_month_to_sheet_for_pastor(pastor_username, year, month, "Pending AO approval")
                     clear_month_dirty(year, month)
-                    sync_from_sheets_if_needed(force=True)
-                    sync_local_month_from_cache_for_pastor(year, month)
+                    # The export deleted the month's old rows and shifted every row below them:
+                    # reload Report before a status write uses the stale cached sheet_row numbers.
+                    _sync_report_cache_only()
             except Exception as e:
                 print("Error exporting month to sheet on submit:", e)
 
@@ -5072,7 +5837,7 @@ def pastor_tool():
         year=year,
         month=month,
         year_options=year_options,
-        month_names=month_names,
+        month_names=MONTH_NAMES,
         monthly_report=monthly_report,
         sunday_list=sunday_list,
         can_submit=can_submit and not bool(monthly_report["approved"]),
@@ -5148,18 +5913,15 @@ def sunday_detail(year, month, day):
             "tithes_personal",
         ]
 
-        numeric_values = {}
-        for field in fields:
-            raw = (request.form.get(field) or "").strip()
-            values[field] = raw
-            if raw == "":
-                error = "All fields are required."
-                break
+        raw = [_form(field) for field in fields]
+        values = dict(zip(fields, raw))
+        if "" in raw:
+            error = "All fields are required."
+        else:
             try:
-                numeric_values[field] = float(raw)
+                numeric_values = dict(zip(fields, map(float, raw)))
             except ValueError:
                 error = "Please enter numbers only in all fields."
-                break
 
         if not error:
             # ✅ HARD REPLACE (prevents duplicates / stale rows)
@@ -5176,6 +5938,9 @@ def sunday_detail(year, month, day):
                 INSERT INTO sunday_reports (
                     monthly_report_id,
                     date,
+                    y,
+                    m,
+                    d,
                     is_complete,
                     attendance_adult,
                     attendance_youth,
@@ -5185,11 +5950,14 @@ def sunday_detail(year, month, day):
                     offering,
                     mission,
                     tithes_personal
-                ) VALUES (?, ?, 1, ?, ?, ?, NULL, ?, ?, ?, ?)
+                ) VALUES (?, ?, ?, ?, ?, 1, ?, ?, ?, NULL, ?, ?, ?, ?)
                 """,
                 (
                     monthly_report["id"],
                     d.isoformat(),
+                    d.year,
+                    d.month,
+                    d.day,
                     numeric_values["attendance_adult"],
                     numeric_values["attendance_youth"],
                     numeric_values["attendance_children"],
@@ -5199,6 +5967,7 @@ def sunday_detail(year, month, day):
                     numeric_values["tithes_personal"],
                 ),
             )
+            _clear_cache_digest(cursor, monthly_report["id"])
 
             db.commit()
             mark_month_dirty(year, month)
@@ -5273,18 +6042,15 @@ def church_progress_view(year, month):
             "healed",
             "child_dedication",
         ]
-        numeric_values = {}
-        for field in fields:
-            raw = (request.form.get(field) or "").strip()
-            values[field] = raw
-            if raw == "":
-                error = "All fields are required for Church Progress."
-                break
+        raw = [_form(field) for field in fields]
+        values = dict(zip(fields, raw))
+        if "" in raw:
+            error = "All fields are required for Church Progress."
+        else:
             try:
-                numeric_values[field] = int(raw)
+                numeric_values = dict(zip(fields, map(int, raw)))
             except ValueError:
                 error = "Please enter whole numbers only in all Church Progress fields."
-                break
 
         if not error:
             cursor.execute(
@@ -5311,6 +6077,7 @@ def church_progress_view(year, month):
                     cp_row["id"],
                 ),
             )
+            _clear_cache_digest(cursor, monthly_report["id"])
             db.commit()
             mark_month_dirty(year, month)
 
@@ -5344,14 +6111,13 @@ def church_progress_view(year, month):
 @app.route("/ao-login", methods=["GET", "POST"])
 def ao_login():
     error = None
-    next_url = request.args.get("next") or url_for("bulletin")
 
     if request.method == "POST":
-        username = (request.form.get("username") or "").strip()
-        password = (request.form.get("password") or "").strip()
+        username = _form("username")
+        password = _form("password")
 
         # Ensure cache is fresh enough for login
-        sync_from_sheets_if_needed(force=True)
+        sync_from_sheets_if_needed(force=True, max_age=FORCED_SYNC_TTL_SECONDS)
 
         row = get_db().execute(
             """
@@ -5362,7 +6128,7 @@ def ao_login():
             (username,),
         ).fetchone()
 
-        if row and (str(row["password"] or "").strip() == password):
+        if row and _secret_matches(row["password"], password):
             pos = str((row["position"] if "position" in row.keys() else "") or "").strip().lower()
             if pos in ("area overseer", "sub area overseer"):
                 session["ao_logged_in"] = True
@@ -5372,11 +6138,13 @@ def ao_login():
                 session["ao_church_id"] = (row["sex"] or "").strip()
                 session["ao_role"] = (row["position"] or "").strip()
                 session["ao_sub_area"] = (row["sub_area"] or "").strip()
-                session.permanent = True
+                if not session.permanent:
+                    session.permanent = True
                 return redirect(url_for("bulletin"))
 
         error = "Invalid username or password."
 
+    next_url = request.args.get("next") or url_for("bulletin")
     return render_template("ao_login.html", error=error, next_url=next_url)
 
 
@@ -5414,14 +6182,7 @@ def ao_tool():
     )
 
 def _get_account_cache_row(username: str):
-    return get_db().execute(
-        """
-        SELECT *
-        FROM sheet_accounts_cache
-        WHERE TRIM(username) = TRIM(?)
-        """,
-        (username,),
-    ).fetchone()
+    return _lookup_account(username)
 
 @app.route("/ao-tool/edit-account/save", methods=["POST"])
 def ao_edit_account_save():
@@ -5628,37 +6389,71 @@ def ao_create_account():
                 error = "Age must be a number."
             else:
                 db = get_db()
-                cursor = db.cursor()
-
-                existing = get_db().execute(
-                    """
-                    SELECT username FROM sheet_accounts_cache
-                    WHERE TRIM(name) = TRIM(?) AND TRIM(church_address) = TRIM(?)
-                    LIMIT 1
-                    """,
-                    (full_name, church_address),
-                ).fetchone()
-                if existing:
-                    error = "Account already exists for this pastor and church."
-                else:
-                    username, password = generate_pastor_credentials(full_name, age_int)
-
-                    try:
-                        cursor.execute(
+                username, password = generate_pastor_credentials(full_name, age_int)
+
+                try:
+                    # One statement: skip pastors already on the Accounts sheet.
+                    created = db.execute(
+                        """
+                        INSERT INTO pastors
+                        (full_name, age, sex, church_address, contact_number, birthday, username, password)
+                        SELECT ?, ?, ?, ?, ?, ?, ?, ?
+                        WHERE NOT EXISTS (
+                            SELECT 1 FROM sheet_accounts_cache
+                            WHERE TRIM(name) = TRIM(?) AND TRIM(church_address) = TRIM(?)
+                        )
+                        RETURNING id
+                        """,
+                        (
+                            full_name,
+                            age_int,
+                            sex,
+                            church_address,
+                            contact_number,
+                            birthday_raw,
+                            username,
+                            password,
+                            full_name,
+                            church_address,
+                        ),
+                    ).fetchone()
+                    if created is None:
+                        db.rollback()
+                        error = "Account already exists for this pastor and church."
+                    else:
+                        pastor_data = {
+                            "full_name": full_name,
+                            "age": age_int,
+                            "sex": sex,
+                            "church_address": church_address,
+                            "contact_number": contact_number,
+                            "birthday": birthday_raw,
+                            "username": username,
+                            "password": password,
+                            "position": "Pastor",
+                            "sub_area": (session.get("ao_sub_area") or "").strip() if ao_is_sub_area_overseer() else "",
+                        }
+
+                        # The sheet append runs on the worker: list the account in the Accounts
+                        # cache now (sheet_row comes with the worker's sync) so a double submit
+                        # hits the duplicate check above instead of creating a second account.
+                        db.execute(
                             """
-                            INSERT INTO pastors
-                            (full_name, age, sex, church_address, contact_number, birthday, username, password)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                            INSERT INTO sheet_accounts_cache
+                            (username, name, church_address, password, age, sex, contact, birthday, position, sub_area)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                             """,
                             (
+                                username,
                                 full_name,
-                                age_int,
-                                sex,
                                 church_address,
+                                password,
+                                str(age_int),
+                                sex,
                                 contact_number,
                                 birthday_raw,
-                                username,
-                                password,
+                                pastor_data["position"],
+                                pastor_data["sub_area"],
                             ),
                         )
                         db.commit()
@@ -5666,26 +6461,11 @@ def ao_create_account():
                         generated_username = username
                         generated_password = password
 
-                        pastor_data = {
-                            "full_name": full_name,
-                            "age": age_int,
-                            "sex": sex,
-                            "church_address": church_address,
-                            "contact_number": contact_number,
-                            "birthday": birthday_raw,
-                            "username": username,
-                            "password": password,
-                            "position": "Pastor",
-                            "sub_area": (session.get("ao_sub_area") or "").strip() if ao_is_sub_area_overseer() else "",
-                        }
-                        try:
-                            append_account_to_sheet(pastor_data)
-                            sync_from_sheets_if_needed(force=True)
-                        except Exception as e:
-                            print("Error sending account to Google Sheets:", e)
+                        enqueue_sheets_write("append_account", pastor_data)
 
-                    except sqlite3.IntegrityError:
-                        error = "Unable to create account (username conflict). Please try again."
+                except sqlite3.IntegrityError:
+                    db.rollback()
+                    error = "Unable to create account (username conflict). Please try again."
 
     return render_template(
        "ao_create_account.html",
@@ -5714,27 +6494,28 @@ def ao_church_status():
 
     year_options = list(range(2025, 2036))
 
-    month_names = [
-        ("January", 1), ("February", 2), ("March", 3), ("April", 4),
-        ("May", 5), ("June", 6), ("July", 7), ("August", 8),
-        ("September", 9), ("October", 10), ("November", 11), ("December", 12),
-    ]
-
     all_churches = get_all_churches_from_cache()
     ao_area_number = (session.get("ao_area_number") or "").strip()
 
     months = []
-    prev_avg_attendance_by_church = {}
 
-    for name, m in month_names:
+    # Whole year up front: one stats query and one AOPT query instead of one per church per month.
+    year_stats = get_report_stats_for_year_cache(year, all_churches)
+    aopt_amounts = get_aopt_amounts_from_cache(
+        [f"{name} {year}" for name, _ in MONTH_NAMES],
+        ao_area_number,
+        (session.get("ao_sub_area") or "").strip() if ao_is_sub_area_overseer() else "",
+    )
+
+    for name, m in MONTH_NAMES:
         church_items = []
         all_reported = True
 
         month_label = f"{name} {year}"
-        aopt_amount = get_aopt_amount_from_cache(month_label, ao_area_number, (session.get("ao_sub_area") or "").strip() if ao_is_sub_area_overseer() else "")
+        aopt_amount = aopt_amounts.get(month_label)
 
         for church in all_churches:
-            stats = get_report_stats_for_month_and_church_cache(year, m, church)
+            stats = year_stats.get((church, m)) or _report_stats_from_aggregate(church, None)
             has_data = stats["rows"] > 0
             if not has_data:
                 all_reported = False
@@ -5747,16 +6528,8 @@ def ao_church_status():
             else:
                 status_key = "pending"
 
-            avg_att = stats["avg"]["adult"] + stats["avg"]["youth"] + stats["avg"]["children"]
-            prev_att = prev_avg_attendance_by_church.get(church)
-
-            if prev_att is None or prev_att == 0 or not has_data:
-                attendance_change = None
-            else:
-                attendance_change = ((avg_att - prev_att) / prev_att) * 100.0
-
-            if has_data:
-                prev_avg_attendance_by_church[church] = avg_att
+            # Computed by the year query (LAG over the church's previous month with rows).
+            attendance_change = stats.get("attendance_change")
 
             church_items.append(
                 {
@@ -5817,15 +6590,13 @@ def ao_aopt_submit():
     if not (year and month):
         return redirect(url_for("ao_church_status", year=year or date.today().year))
 
-    month_label = f"{calendar.month_name[month]} {year}"
+    month_label = f"{MONTH_NAMES[month - 1][0]} {year}"
     amount_val = parse_float(amount_raw)
     area_number = (session.get("ao_area_number") or "").strip()
     sub_area = (session.get("ao_sub_area") or "").strip() if ao_is_sub_area_overseer() else ""
 
     try:
-        client = get_gs_client()
-        sh = client.open("District4 Data")
-        ws = sh.worksheet("AOPT")
+        ws = _get_ws("AOPT")
 
         headers = _ensure_aopt_headers(ws)
         idx_month = _find_col(headers, "Month")
@@ -5852,7 +6623,7 @@ def ao_aopt_submit():
 
             if cached and cached["sheet_row"]:
                 sheet_row = int(cached["sheet_row"])
-                end_col = chr(ord('A') + max(idx_month, idx_amount, idx_area, idx_sub))
+                end_col = _col_letter(max(idx_month, idx_amount, idx_area, idx_sub))
                 row_values = [""] * (max(idx_month, idx_amount, idx_area, idx_sub) + 1)
                 row_values[idx_month] = month_label
                 row_values[idx_amount] = amount_val
@@ -6015,8 +6786,6 @@ def ao_church_status_print_report_finalize(job_id):
 
     return jsonify({"ok": True, "finalized": True, "marked": marked, "message": "ReportStatus updated."})
 
-import threading
-
 download_locks = {}
 download_done = {}
 
@@ -6125,26 +6894,11 @@ def prayer_request_status():
         return redirect(url_for("pastor_login", next=request.path))
 
     # ✅ Force refresh so newly submitted requests always show immediately
-    sync_from_sheets_if_needed(force=True)
+    sync_from_sheets_if_needed(force=True, max_age=FORCED_SYNC_TTL_SECONDS)
 
     submitted_by = _current_user_key()
-    rows = get_prayer_requests_for_user(submitted_by, include_answered=False)
-
-    items = []
-    for r in rows:
-        items.append(
-            {
-                "request_id": r["request_id"],
-                "church_name": r["church_name"] or "",
-                "submitted_by": r["submitted_by"] or "",
-                "title": r["title"] or "",
-                "request_date": r["request_date"] or "",
-                "request_text": r["request_text"] or "",
-                "status": r["status"] or "Pending",
-                "pastors_praying": r["pastors_praying"] or "",
-                "answered_date": r["answered_date"] or "",
-            }
-        )
+    # Rows come back display-ready (PRAYER_DISPLAY_COLUMNS); no per-row dict copies.
+    items = get_prayer_requests_for_user(submitted_by, include_answered=False)
 
     return render_template("prayer_status.html", items=items, user_display=_current_user_display())
 
@@ -6155,26 +6909,11 @@ def prayer_request_answered():
         return redirect(url_for("pastor_login", next=request.path))
 
     # ✅ Refresh so answered requests show immediately
-    sync_from_sheets_if_needed(force=True)
+    sync_from_sheets_if_needed(force=True, max_age=FORCED_SYNC_TTL_SECONDS)
 
     submitted_by = _current_user_key()
-    rows = get_answered_prayer_requests_for_user(submitted_by)
-
-    answered = []
-    for r in rows:
-        answered.append(
-            {
-                "request_id": r["request_id"],
-                "church_name": r["church_name"] or "",
-                "submitted_by": r["submitted_by"] or "",
-                "title": r["title"] or "",
-                "request_date": r["request_date"] or "",
-                "request_text": r["request_text"] or "",
-                "status": r["status"] or "Answered",
-                "pastors_praying": r["pastors_praying"] or "",
-                "answered_date": r["answered_date"] or "",
-            }
-        )
+    # Only TRIM(status) = 'Answered' rows, already display-ready.
+    answered = get_answered_prayer_requests_for_user(submitted_by)
 
     return render_template(
         "prayer_answered.html",
@@ -6218,11 +6957,10 @@ def prayer_request_edit(request_id):
             )
 
         try:
-            _update_prayer_request_cells_in_sheet(
+            queue_prayer_request_update(
                 request_id,
                 {"title": title, "request_text": body},
             )
-            sync_from_sheets_if_needed(force=True)
         except Exception as e:
             print("❌ Error editing prayer request:", e)
 
@@ -6258,7 +6996,6 @@ def prayer_request_delete(request_id):
 
     try:
         _delete_prayer_request_row_in_sheet(request_id)
-        sync_from_sheets_if_needed(force=True)
     except Exception as e:
         print("❌ Error deleting prayer request:", e)
 
@@ -6292,11 +7029,10 @@ def prayer_request_mark_answered(request_id):
         return redirect(url_for("prayer_request_status"))
 
     try:
-        _update_prayer_request_cells_in_sheet(
+        queue_prayer_request_update(
             request_id,
             {"status": "Answered", "answered_date": date.today().isoformat()},
         )
-        sync_from_sheets_if_needed(force=True)
     except Exception as e:
         print("❌ Error marking answered:", e)
 
@@ -6313,22 +7049,9 @@ def ao_prayer_requests():
         return redirect(url_for("ao_login", next=request.path))
 
     # ✅ Always refresh so AO sees latest submissions
-    sync_from_sheets_if_needed(force=True)
+    sync_from_sheets_if_needed(force=True, max_age=FORCED_SYNC_TTL_SECONDS)
 
-    rows = get_pending_prayers_for_ao()
-    items = []
-    for r in rows:
-        items.append(
-            {
-                "request_id": r["request_id"],
-                "church_name": r["church_name"] or "",
-                "submitted_by": r["submitted_by"] or "",
-                "title": r["title"] or "",
-                "request_date": r["request_date"] or "",
-                "request_text": r["request_text"] or "",
-                "status": r["status"] or "Pending",
-            }
-        )
+    items = get_pending_prayers_for_ao()
 
     return render_template("ao_prayer_approval.html", items=items)
 
@@ -6342,8 +7065,7 @@ def ao_prayer_requests_approve(request_id):
         prayer_row = get_db().execute("SELECT * FROM sheet_prayer_request_cache WHERE request_id = ?", (request_id,)).fetchone()
         if not _prayer_in_current_ao_manage_scope(prayer_row):
             abort(403)
-        _update_prayer_request_cells_in_sheet(request_id, {"status": "Approved"})
-        sync_from_sheets_if_needed(force=True)
+        queue_prayer_request_update(request_id, {"status": "Approved"})
     except Exception as e:
         print("❌ Error approving prayer request:", e)
 
@@ -6361,7 +7083,6 @@ def ao_prayer_requests_reject(request_id):
         if not _prayer_in_current_ao_manage_scope(prayer_row):
             abort(403)
         _delete_prayer_request_row_in_sheet(request_id)
-        sync_from_sheets_if_needed(force=True)
     except Exception as e:
         print("❌ Error rejecting prayer request:", e)
 
@@ -6375,14 +7096,16 @@ def ao_prayer_requests_approve_all():
 
     try:
         # refresh then approve everything still pending
-        sync_from_sheets_if_needed(force=True)
+        sync_from_sheets_if_needed(force=True, max_age=FORCED_SYNC_TTL_SECONDS)
         rows = get_pending_prayers_for_ao()
 
-        for r in rows:
-            req_id = (r["request_id"] or "").strip()
-            if not req_id or not _prayer_in_current_ao_manage_scope(r):
-                continue
-            _update_prayer_request_cells_in_sheet(req_id, {"status": "Approved"})
+        # The pending rows already carry sheet_row: no per-request (or IN) lookup needed.
+        sheet_rows = {
+            r["request_id"]: r["sheet_row"]
+            for r in rows
+            if (r["request_id"] or "").strip() and _prayer_in_current_ao_manage_scope(r)
+        }
+        _update_prayer_request_statuses_in_sheet(sheet_rows, "Approved")
 
         sync_from_sheets_if_needed(force=True)
     except Exception as e:
@@ -6393,34 +7116,12 @@ def ao_prayer_requests_approve_all():
 
 
 def _ensure_announcement_sheet_headers(ws):
-    values = ws.get_all_values()
     headers = ["Title", "Announcement", "Date", "Area", "SubArea", "Author Username", "Author Name"]
-    if not values:
-        ws.append_row(headers, value_input_option="USER_ENTERED")
-        return headers
-    current = list(values[0])
-    changed = False
-    for i, name in enumerate(headers):
-        if _find_col(current, name) is None:
-            while len(current) <= i:
-                current.append("")
-            current[i] = name
-            changed = True
-    if changed:
-        rng = f"A1:{chr(ord('A') + len(current) - 1)}1"
-        ws.update(rng, [current], value_input_option="USER_ENTERED")
-        values = ws.get_all_values()
-        return values[0]
-    return current
+    return _ensure_header_row(ws, headers)
 
 
 def _append_announcement_to_sheet(payload: dict):
-    client = get_gs_client()
-    sh = client.open("District4 Data")
-    try:
-        ws = sh.worksheet("Anouncement")
-    except gspread.WorksheetNotFound:
-        ws = sh.add_worksheet(title="Anouncement", rows=1000, cols=10)
+    ws = _get_ws("Anouncement", create=True, rows=1000, cols=10)
     headers = _ensure_announcement_sheet_headers(ws)
     row = [""] * len(headers)
     mapping = {
@@ -6444,9 +7145,7 @@ def _get_announcement_row(sheet_row: int):
 
 
 def _update_announcement_in_sheet(sheet_row: int, payload: dict):
-    client = get_gs_client()
-    sh = client.open("District4 Data")
-    ws = sh.worksheet("Anouncement")
+    ws = _get_ws("Anouncement")
     headers = _ensure_announcement_sheet_headers(ws)
     row = [""] * len(headers)
     mapping = {
@@ -6462,16 +7161,14 @@ def _update_announcement_in_sheet(sheet_row: int, payload: dict):
     for i, h in enumerate(headers):
         if h in mapping:
             row[i] = mapping[h]
-    end_col = chr(ord('A') + len(headers) - 1)
+    end_col = _col_letter(len(headers) - 1)
     ws.update(f"A{int(sheet_row)}:{end_col}{int(sheet_row)}", [row], value_input_option="USER_ENTERED")
 
 
 def _delete_announcement_in_sheet(sheet_row: int):
     if int(sheet_row) <= 1:
         return False
-    client = get_gs_client()
-    sh = client.open("District4 Data")
-    ws = sh.worksheet("Anouncement")
+    ws = _get_ws("Anouncement")
     ws.delete_rows(int(sheet_row))
     return True
 
@@ -6487,7 +7184,7 @@ def _announcement_in_current_scope(row):
     current_sub = ""
     if pastor_logged_in():
         u = (session.get("pastor_username") or "").strip()
-        acc = get_db().execute("SELECT sub_area FROM sheet_accounts_cache WHERE username = ?", (u,)).fetchone()
+        acc = _lookup_account(u)
         current_sub = str(acc["sub_area"] or "").strip() if acc else ""
     elif ao_logged_in():
         current_sub = (session.get("ao_sub_area") or "").strip()
@@ -6529,12 +7226,10 @@ def _update_account_in_sheet(original_username: str, payload: dict):
 
     sheet_row = int(cached["sheet_row"])
 
-    client = get_gs_client()
-    sh = client.open("District4 Data")
-    ws = sh.worksheet("Accounts")
+    ws = _get_ws("Accounts")
     headers = _ensure_accounts_headers(ws)
     row = [_build_account_row_from_headers(headers, payload)]
-    end_col = chr(ord('A') + len(headers) - 1)
+    end_col = _col_letter(len(headers) - 1)
     ws.update(f"A{sheet_row}:{end_col}{sheet_row}", row, value_input_option="USER_ENTERED")
     return True
 
@@ -6552,9 +7247,7 @@ def _delete_account_row_in_sheet(username: str):
     if sheet_row <= 1:
         return False
 
-    client = get_gs_client()
-    sh = client.open("District4 Data")
-    ws = sh.worksheet("Accounts")
+    ws = _get_ws("Accounts")
 
     ws.delete_rows(sheet_row)
     return True
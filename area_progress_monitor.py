@@ -3,6 +3,8 @@ from __future__ import annotations
 import calendar
 import os
 import sqlite3
+import threading
+import time
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
@@ -23,6 +25,12 @@ GOOGLE_SHEETS_SCOPES = [
 ]
 SYNC_INTERVAL_SECONDS = 120
 
+# Reopened every 30 minutes, which is also when rejected credentials get noticed and rebuilt.
+GS_HANDLE_TTL_SECONDS = 30 * 60
+_GS_CLIENT = None
+_GS_SPREADSHEET = None  # (expires_at, client, spreadsheet)
+_GS_LOCK = threading.Lock()
+
 PALETTE = [
     "#2563eb", "#16a34a", "#dc2626", "#f59e0b", "#7c3aed",
     "#0891b2", "#ea580c", "#65a30d", "#be185d", "#0f766e",
@@ -479,12 +487,30 @@ def _lower(s):
     return str(s or "").strip().lower()
 
 
-def _find_col(headers, wanted):
-    wanted = _lower(wanted)
+def _header_map(headers):
+    """Header row -> {lowercased, stripped header: first column index}."""
+    hmap = {}
     for i, h in enumerate(headers):
-        if _lower(h) == wanted:
-            return i
-    return None
+        hmap.setdefault(_lower(h), i)
+    return hmap
+
+
+# get_all_values() only hands back strings, so cells skip the str() round trip.
+_sheet_text = str.strip
+
+
+def _row_projector(cols):
+    """
+    cols: [(column_index_or_None, converter), ...] resolved once per sheet.
+    Returns row -> tuple of converted cells; missing/short cells convert "".
+    """
+    cols = tuple(cols)
+
+    def project(row):
+        n = len(row)
+        return tuple([conv(row[i]) if i is not None and i < n else conv("") for i, conv in cols])
+
+    return project
 
 
 def parse_sheet_date(value):
@@ -540,11 +566,64 @@ def get_last_sync_display_ph() -> str:
 
 
 def get_gs_client():
-    creds = Credentials.from_service_account_file(
-        GOOGLE_SHEETS_CREDENTIALS_FILE,
-        scopes=GOOGLE_SHEETS_SCOPES,
-    )
-    return gspread.authorize(creds)
+    global _GS_CLIENT
+    with _GS_LOCK:
+        # Built once: the authorized session refreshes its own access token.
+        if _GS_CLIENT is None:
+            creds = Credentials.from_service_account_file(
+                GOOGLE_SHEETS_CREDENTIALS_FILE,
+                scopes=GOOGLE_SHEETS_SCOPES,
+            )
+            _GS_CLIENT = gspread.authorize(creds)
+        return _GS_CLIENT
+
+
+def _open_district_sheet():
+    """The "District4 Data" spreadsheet, opened once per TTL."""
+    global _GS_CLIENT, _GS_SPREADSHEET
+    for attempt in range(2):
+        client = get_gs_client()
+        with _GS_LOCK:
+            cached = _GS_SPREADSHEET
+            if cached is not None and cached[0] > time.monotonic() and cached[1] is client:
+                return cached[2]
+        try:
+            sh = client.open("District4 Data")
+        except gspread.exceptions.APIError as e:
+            # Rejected credentials (e.g. a rotated key): rebuild the client once.
+            if attempt or getattr(e.response, "status_code", None) not in (401, 403):
+                raise
+            with _GS_LOCK:
+                if _GS_CLIENT is client:
+                    _GS_CLIENT = None
+            continue
+        with _GS_LOCK:
+            _GS_SPREADSHEET = (time.monotonic() + GS_HANDLE_TTL_SECONDS, client, sh)
+        return sh
+
+
+def _batch_get_values(sh, titles):
+    """
+    Whole-tab values for titles, in order, from one values.batchGet call (formatted
+    strings, like get_all_values()). Read before the DELETEs in the sync so the write
+    lock is never held across the network. If the batch fails (e.g. a missing tab),
+    falls back to tab-by-tab reads so one bad tab only empties its own cache.
+    """
+    try:
+        resp = sh.values_batch_get(["'" + t.replace("'", "''") + "'" for t in titles])
+        value_ranges = resp.get("valueRanges", [])
+        if len(value_ranges) == len(titles):
+            return [vr.get("values", []) for vr in value_ranges]
+    except Exception:
+        pass
+
+    out = []
+    for title in titles:
+        try:
+            out.append(sh.worksheet(title).get_all_values())
+        except Exception:
+            out.append([])
+    return out
 
 
 def sync_from_sheets_if_needed(force: bool = False):
@@ -552,219 +631,158 @@ def sync_from_sheets_if_needed(force: bool = False):
     if not force and last and (datetime.now(timezone.utc) - last).total_seconds() < SYNC_INTERVAL_SECONDS:
         return
 
-    client = get_gs_client()
-    sh = client.open("District4 Data")
+    sh = _open_district_sheet()
+
+    acc_values, rep_values, aopt_values, pr_values = _batch_get_values(
+        sh, ("Accounts", "Report", "AOPT", "PrayerRequest")
+    )
+
     conn = _connect()
     cur = conn.cursor()
 
     # Accounts
-    try:
-        ws_accounts = sh.worksheet("Accounts")
-        values = ws_accounts.get_all_values()
-    except Exception:
-        values = []
+    values = acc_values
     cur.execute("DELETE FROM sheet_accounts_cache")
     if values and len(values) >= 2:
-        headers = values[0]
-        i_name = _find_col(headers, "Name")
-        i_user = _find_col(headers, "UserName")
-        i_pass = _find_col(headers, "Password")
-        i_addr = _find_col(headers, "Church Address")
-        i_age = _find_col(headers, "Area Number")
+        hmap = _header_map(values[0])
+        i_age = hmap.get("area number")
         if i_age is None:
-            i_age = _find_col(headers, "Age")
-        i_sex = _find_col(headers, "Church ID")
+            i_age = hmap.get("age")
+        i_sex = hmap.get("church id")
         if i_sex is None:
-            i_sex = _find_col(headers, "Sex")
-        i_contact = _find_col(headers, "Contact #")
-        i_bday = _find_col(headers, "Birth Day")
-        i_pos = _find_col(headers, "Position")
-        i_sub = _find_col(headers, "Sub Area")
+            i_sex = hmap.get("sex")
+        i_sub = hmap.get("sub area")
         if i_sub is None:
-            i_sub = _find_col(headers, "SubArea")
-
-        for r in range(1, len(values)):
-            row = values[r]
-            def cell(idx):
-                return row[idx] if idx is not None and idx < len(row) else ""
-            username = str(cell(i_user)).strip()
-            full_name = str(cell(i_name)).strip()
-            church_address = str(cell(i_addr)).strip()
-            area_number = str(cell(i_age)).strip()
-            church_id = str(cell(i_sex)).strip()
-            if not area_number and not church_id and not full_name and not church_address:
-                continue
-            cur.execute(
-                """
-                INSERT OR REPLACE INTO sheet_accounts_cache
-                (username, name, church_address, password, age, sex, contact, birthday, position, sub_area, sheet_row)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    username,
-                    full_name,
-                    church_address,
-                    str(cell(i_pass)).strip(),
-                    area_number,
-                    church_id,
-                    str(cell(i_contact)).strip(),
-                    str(cell(i_bday)).strip(),
-                    str(cell(i_pos)).strip(),
-                    str(cell(i_sub)).strip(),
-                    r + 1,
-                ),
-            )
+            i_sub = hmap.get("subarea")
+        project = _row_projector(
+            [
+                (hmap.get("username"), _sheet_text),
+                (hmap.get("name"), _sheet_text),
+                (hmap.get("church address"), _sheet_text),
+                (hmap.get("password"), _sheet_text),
+                (i_age, _sheet_text),
+                (i_sex, _sheet_text),
+                (hmap.get("contact #"), _sheet_text),
+                (hmap.get("birth day"), _sheet_text),
+                (hmap.get("position"), _sheet_text),
+                (i_sub, _sheet_text),
+            ]
+        )
+        # vals: username, name, church_address, password, area_number, church_id, ...
+        cur.executemany(
+            """
+            INSERT OR REPLACE INTO sheet_accounts_cache
+            (username, name, church_address, password, age, sex, contact, birthday, position, sub_area, sheet_row)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                vals + (sheet_row,)
+                for sheet_row, vals in enumerate(map(project, values[1:]), start=2)
+                if vals[4] or vals[5] or vals[1] or vals[2]
+            ],
+        )
 
     # Report
-    try:
-        ws_report = sh.worksheet("Report")
-        values = ws_report.get_all_values()
-    except Exception:
-        values = []
+    values = rep_values
     cur.execute("DELETE FROM sheet_report_cache")
     if values and len(values) >= 2:
-        headers = values[0]
-        i_activity = _find_col(headers, "activity_date")
-        i_status = _find_col(headers, "status")
-        i_church = _find_col(headers, "church")
-        i_pastor = _find_col(headers, "pastor")
-        i_address = _find_col(headers, "address")
-        i_adult = _find_col(headers, "adult")
-        i_youth = _find_col(headers, "youth")
-        i_children = _find_col(headers, "children")
-        i_tithes = _find_col(headers, "tithes")
-        i_offering = _find_col(headers, "offering")
-        i_personal = _find_col(headers, "personal tithes")
-        i_mission = _find_col(headers, "mission offering")
-        i_recv = _find_col(headers, "received jesus")
-        i_exist = _find_col(headers, "existing bible study")
-        i_new = _find_col(headers, "new bible study")
-        i_water = _find_col(headers, "water baptized")
-        i_holy = _find_col(headers, "holy spirit baptized")
-        i_ded = _find_col(headers, "childrens dedication")
-        i_healed = _find_col(headers, "healed")
-        i_send = _find_col(headers, "amount to send")
-        for r in range(1, len(values)):
-            row = values[r]
-            def cell(idx):
-                return row[idx] if idx is not None and idx < len(row) else ""
-            d = parse_sheet_date(cell(i_activity))
-            if not d:
-                continue
-            cur.execute(
-                """
-                INSERT INTO sheet_report_cache (
-                    sheet_row, year, month, activity_date,
-                    church, pastor, address,
-                    adult, youth, children,
-                    tithes, offering, personal_tithes, mission_offering,
-                    received_jesus, existing_bible_study, new_bible_study,
-                    water_baptized, holy_spirit_baptized, childrens_dedication, healed,
-                    amount_to_send, status
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    r + 1, d.year, d.month, d.isoformat(),
-                    str(cell(i_church)).strip(),
-                    str(cell(i_pastor)).strip(),
-                    str(cell(i_address)).strip(),
-                    _safe_float(cell(i_adult)),
-                    _safe_float(cell(i_youth)),
-                    _safe_float(cell(i_children)),
-                    _safe_float(cell(i_tithes)),
-                    _safe_float(cell(i_offering)),
-                    _safe_float(cell(i_personal)),
-                    _safe_float(cell(i_mission)),
-                    _safe_float(cell(i_recv)),
-                    _safe_float(cell(i_exist)),
-                    _safe_float(cell(i_new)),
-                    _safe_float(cell(i_water)),
-                    _safe_float(cell(i_holy)),
-                    _safe_float(cell(i_ded)),
-                    _safe_float(cell(i_healed)),
-                    _safe_float(cell(i_send)),
-                    str(cell(i_status)).strip(),
-                ),
-            )
+        hmap = _header_map(values[0])
+        project = _row_projector(
+            [(hmap.get("activity_date"), parse_sheet_date)]
+            + [(hmap.get(name), _sheet_text) for name in ("church", "pastor", "address")]
+            + [
+                (hmap.get(name), _safe_float)
+                for name in (
+                    "adult", "youth", "children",
+                    "tithes", "offering", "personal tithes", "mission offering",
+                    "received jesus", "existing bible study", "new bible study",
+                    "water baptized", "holy spirit baptized", "childrens dedication", "healed",
+                    "amount to send",
+                )
+            ]
+            + [(hmap.get("status"), _sheet_text)]
+        )
+        # Rows without a parseable activity_date are skipped.
+        cur.executemany(
+            """
+            INSERT INTO sheet_report_cache (
+                sheet_row, year, month, activity_date,
+                church, pastor, address,
+                adult, youth, children,
+                tithes, offering, personal_tithes, mission_offering,
+                received_jesus, existing_bible_study, new_bible_study,
+                water_baptized, holy_spirit_baptized, childrens_dedication, healed,
+                amount_to_send, status
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (sheet_row, vals[0].year, vals[0].month, vals[0].isoformat()) + vals[1:]
+                for sheet_row, vals in enumerate(map(project, values[1:]), start=2)
+                if vals[0]
+            ],
+        )
 
     # AOPT
-    try:
-        ws_aopt = sh.worksheet("AOPT")
-        values = ws_aopt.get_all_values()
-    except Exception:
-        values = []
+    values = aopt_values
     cur.execute("DELETE FROM sheet_aopt_cache")
     if values and len(values) >= 2:
-        headers = values[0]
-        i_month = _find_col(headers, "Month")
-        i_amount = _find_col(headers, "Amount")
-        i_area = _find_col(headers, "Area Number")
+        hmap = _header_map(values[0])
+        i_area = hmap.get("area number")
         if i_area is None:
-            i_area = _find_col(headers, "Area")
-        i_sub = _find_col(headers, "Sub Area")
+            i_area = hmap.get("area")
+        i_sub = hmap.get("sub area")
         if i_sub is None:
-            i_sub = _find_col(headers, "SubArea")
-        for r in range(1, len(values)):
-            row = values[r]
-            def cell(idx):
-                return row[idx] if idx is not None and idx < len(row) else ""
-            month_label = str(cell(i_month)).strip()
-            if not month_label:
-                continue
-            cur.execute(
-                "INSERT OR REPLACE INTO sheet_aopt_cache (month, area_number, sub_area, amount, sheet_row) VALUES (?, ?, ?, ?, ?)",
-                (month_label, str(cell(i_area)).strip(), str(cell(i_sub)).strip(), _safe_float(cell(i_amount)), r + 1),
-            )
+            i_sub = hmap.get("subarea")
+        project = _row_projector(
+            [
+                (hmap.get("month"), _sheet_text),
+                (i_area, _sheet_text),
+                (i_sub, _sheet_text),
+                (hmap.get("amount"), _safe_float),
+            ]
+        )
+        # Rows without a Month are skipped.
+        cur.executemany(
+            "INSERT OR REPLACE INTO sheet_aopt_cache (month, area_number, sub_area, amount, sheet_row) VALUES (?, ?, ?, ?, ?)",
+            [
+                vals + (sheet_row,)
+                for sheet_row, vals in enumerate(map(project, values[1:]), start=2)
+                if vals[0]
+            ],
+        )
 
     # PrayerRequest
-    try:
-        ws_pr = sh.worksheet("PrayerRequest")
-        values = ws_pr.get_all_values()
-    except Exception:
-        values = []
+    values = pr_values
     try:
         cur.execute("DELETE FROM sheet_prayer_request_cache")
         if values and len(values) >= 2:
-            headers = values[0]
-            i_church = _find_col(headers, "Church Name")
-            i_submitted_by = _find_col(headers, "Submitted By")
-            i_request_id = _find_col(headers, "Request ID")
-            i_title = _find_col(headers, "Prayer Request Title")
-            i_request_date = _find_col(headers, "Prayer Request Date")
-            i_request_text = _find_col(headers, "Prayer Request")
-            i_status = _find_col(headers, "Status")
-            if i_status is None:
-                i_status = _find_col(headers, "status")
-            i_praying = _find_col(headers, "Pastor's Praying")
-            i_answered = _find_col(headers, "Answered Date")
-
-            for r in range(1, len(values)):
-                row = values[r]
-                def cell(idx):
-                    return row[idx] if idx is not None and idx < len(row) else ""
-                req_id = str(cell(i_request_id)).strip()
-                if not req_id:
-                    req_id = f"row-{r+1}"
-                cur.execute(
-                    """
-                    INSERT OR REPLACE INTO sheet_prayer_request_cache (
-                        request_id, church_name, submitted_by, title, request_date,
-                        request_text, status, pastors_praying, answered_date, sheet_row
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        req_id,
-                        str(cell(i_church)).strip(),
-                        str(cell(i_submitted_by)).strip(),
-                        str(cell(i_title)).strip(),
-                        str(cell(i_request_date)).strip(),
-                        str(cell(i_request_text)).strip(),
-                        str(cell(i_status)).strip(),
-                        str(cell(i_praying)).strip(),
-                        str(cell(i_answered)).strip(),
-                        r + 1,
-                    ),
-                )
+            hmap = _header_map(values[0])
+            project = _row_projector(
+                [
+                    (hmap.get("request id"), _sheet_text),
+                    (hmap.get("church name"), _sheet_text),
+                    (hmap.get("submitted by"), _sheet_text),
+                    (hmap.get("prayer request title"), _sheet_text),
+                    (hmap.get("prayer request date"), _sheet_text),
+                    (hmap.get("prayer request"), _sheet_text),
+                    (hmap.get("status"), _sheet_text),
+                    (hmap.get("pastor's praying"), _sheet_text),
+                    (hmap.get("answered date"), _sheet_text),
+                ]
+            )
+            # Rows without a Request ID are keyed by their sheet row.
+            cur.executemany(
+                """
+                INSERT OR REPLACE INTO sheet_prayer_request_cache (
+                    request_id, church_name, submitted_by, title, request_date,
+                    request_text, status, pastors_praying, answered_date, sheet_row
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (vals[0] or f"row-{sheet_row}",) + vals[1:] + (sheet_row,)
+                    for sheet_row, vals in enumerate(map(project, values[1:]), start=2)
+                ],
+            )
     except Exception:
         pass
 
@@ -1274,8 +1292,7 @@ def _mark_notifications_seen(scope: Scope, notification_ids: list[str]) -> int:
 
 def _members_for_scope_from_sheet(scope: Scope, churches: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
     try:
-        client = get_gs_client()
-        sh = client.open("District4 Data")
+        sh = _open_district_sheet()
         ws = sh.worksheet("Members Account")
         values = ws.get_all_values()
     except Exception:
@@ -1284,37 +1301,40 @@ def _members_for_scope_from_sheet(scope: Scope, churches: dict[str, dict[str, An
     if len(values) < 2:
         return []
 
-    headers = values[0]
-    i_name = _find_col(headers, "Name")
-    i_bday = _find_col(headers, "BDay")
+    hmap = _header_map(values[0])
+    i_bday = hmap.get("bday")
     if i_bday is None:
-        i_bday = _find_col(headers, "Birthday")
-    i_church = _find_col(headers, "Church ID")
-    i_address = _find_col(headers, "Church Address")
-    i_area = _find_col(headers, "Area Number")
-    i_pastor = _find_col(headers, "Pastor")
-    i_user = _find_col(headers, "UserName")
-    i_pass = _find_col(headers, "Password")
+        i_bday = hmap.get("birthday")
+    project = _row_projector(
+        [
+            (hmap.get("church id"), _sheet_text),
+            (hmap.get("church address"), _sheet_text),
+            (hmap.get("area number"), _sheet_text),
+            (hmap.get("name"), _sheet_text),
+            (i_bday, _sheet_text),
+            (hmap.get("pastor"), _sheet_text),
+            (hmap.get("username"), _sheet_text),
+            (hmap.get("password"), _sheet_text),
+        ]
+    )
+    scope_area = str(scope.area).strip()
 
     members = []
     for r, row in enumerate(values[1:], start=2):
-        def cell(idx):
-            return row[idx] if idx is not None and idx < len(row) else ""
-        church_name = str(cell(i_church)).strip()
-        church_address = str(cell(i_address)).strip()
+        church_name, church_address, area, name, birthday, pastor, username, password = project(row)
         church_key = _resolve_church_key(churches, church_name, church_address)
         if not church_key:
             continue
-        if str(cell(i_area)).strip() and str(cell(i_area)).strip() != str(scope.area).strip():
+        if area and area != scope_area:
             continue
         members.append({
-            "name": str(cell(i_name)).strip(),
-            "birthday": str(cell(i_bday)).strip(),
+            "name": name,
+            "birthday": birthday,
             "church_key": church_key,
             "church_name": churches[church_key]["church_name"],
-            "pastor": str(cell(i_pastor)).strip(),
-            "username": str(cell(i_user)).strip(),
-            "password": str(cell(i_pass)).strip(),
+            "pastor": pastor,
+            "username": username,
+            "password": password,
             "sheet_row": r,
         })
     return members
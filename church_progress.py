@@ -107,13 +107,13 @@ def _get_members_ws():
 
 
 def _ensure_members_headers(ws):
-    values = ws.get_all_values()
+    # Only row 1 is needed here; the member rows are read by the callers that use them.
+    current = ws.row_values(1)
 
-    if not values:
+    if not current:
         ws.update("A1:H1", [MEMBER_HEADERS], value_input_option="USER_ENTERED")
         return MEMBER_HEADERS
 
-    current = list(values[0])
     changed = False
 
     for idx, header in enumerate(MEMBER_HEADERS):
@@ -3,7 +3,6 @@ import re
 import sys
 from datetime import datetime, date
 
-import gspread
 from flask import render_template, request, redirect, url_for, session, flash
 
 
@@ -18,8 +17,20 @@ def get_db():
     return _appmod().get_db()
 
 
-def get_gs_client():
-    return _appmod().get_gs_client()
+def open_district_sheet():
+    return _appmod().open_district_sheet()
+
+
+def _get_ws(title, create=False, rows=1000, cols=12):
+    return _appmod()._get_ws(title, create=create, rows=rows, cols=cols)
+
+
+def _header_row(ws):
+    return _appmod()._header_row(ws)
+
+
+def _invalidate_headers(ws, headers=None):
+    return _appmod()._invalidate_headers(ws, headers)
 
 
 def parse_sheet_date(value):
@@ -45,6 +56,10 @@ def _ensure_accounts_headers(ws):
 def _build_account_row_from_headers(headers, payload):
     return _appmod()._build_account_row_from_headers(headers, payload)
 
+
+def _col_letter(idx):
+    return _appmod()._col_letter(idx)
+
 DISTRICT_SCHEDULE_SHEET_NAME = "DistrictSchedule"
 DISTRICT_SECRETARY_CODE = "District_Secretary_444"
 CHAIN_PRAYER_SCHEDULE_SHEET_NAME = "ChainPrayerSchedules"
@@ -115,14 +130,9 @@ def _normalize_schedule_search_value(value):
     return text
 
 def _ensure_district_schedule_headers():
-    client = get_gs_client()
-    sh = client.open("District4 Data")
-    try:
-        ws = sh.worksheet(DISTRICT_SCHEDULE_SHEET_NAME)
-    except gspread.WorksheetNotFound:
-        ws = sh.add_worksheet(title=DISTRICT_SCHEDULE_SHEET_NAME, rows=1000, cols=12)
-
-    values = ws.get_all_values()
+    ws = _get_ws(DISTRICT_SCHEDULE_SHEET_NAME, create=True, rows=1000, cols=12)
+
+    current = _header_row(ws)
     headers = [
         "Church Name",
         "Church Address",
@@ -136,11 +146,11 @@ def _ensure_district_schedule_headers():
         "Theme",
         "Text",
     ]
-    if not values:
+    if not current:
         ws.append_row(headers, value_input_option="USER_ENTERED")
+        _invalidate_headers(ws, headers)
         return ws
 
-    current = list(values[0])
     changed = False
     for i, name in enumerate(headers):
         if name not in current:
@@ -149,8 +159,9 @@ def _ensure_district_schedule_headers():
             current[i] = name
             changed = True
     if changed:
-        rng = f"A1:{chr(ord('A') + len(current) - 1)}1"
+        rng = f"A1:{_col_letter(len(current) - 1)}1"
         ws.update(rng, [current], value_input_option="USER_ENTERED")
+        _invalidate_headers(ws, current)
     return ws
 
 def _append_district_schedule_row(payload: dict):
@@ -238,12 +249,10 @@ def _update_account_google_pin(area_number: str, church_name: str, google_pin_lo
         'sub_area': acct['sub_area'] or '',
         'google_pin_location': google_pin_location or '',
     }
-    client = get_gs_client()
-    sh = client.open("District4 Data")
-    ws = sh.worksheet("Accounts")
+    ws = _get_ws("Accounts")
     headers = _ensure_accounts_headers(ws)
     row = [_build_account_row_from_headers(headers, payload)]
-    end_col = chr(ord('A') + len(headers) - 1)
+    end_col = _col_letter(len(headers) - 1)
     ws.update(f"A{int(acct['sheet_row'])}:{end_col}{int(acct['sheet_row'])}", row, value_input_option="USER_ENTERED")
     return True
 
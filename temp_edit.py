@@ -25,8 +25,20 @@ def get_db():
     return _appmod().get_db()
 
 
-def get_gs_client():
-    return _appmod().get_gs_client()
+def open_district_sheet():
+    return _appmod().open_district_sheet()
+
+
+def _get_ws(title, create=False, rows=1000, cols=12):
+    return _appmod()._get_ws(title, create=create, rows=rows, cols=cols)
+
+
+def _header_row(ws):
+    return _appmod()._header_row(ws)
+
+
+def _invalidate_headers(ws, headers=None):
+    return _appmod()._invalidate_headers(ws, headers)
 
 
 def sync_from_sheets_if_needed(force=False):
@@ -41,6 +53,10 @@ def _build_account_row_from_headers(headers, payload):
     return _appmod()._build_account_row_from_headers(headers, payload)
 
 
+def _col_letter(idx):
+    return _appmod()._col_letter(idx)
+
+
 def _ensure_temp_edit_tables():
     db = get_db()
     db.execute(
@@ -177,20 +193,15 @@ def _compress_image_lowest(file_storage):
 
 
 def _ensure_temp_edit_sheet():
-    client = get_gs_client()
-    sh = client.open("District4 Data")
-    try:
-        ws = sh.worksheet(TEMP_EDIT_SHEET_NAME)
-    except Exception:
-        ws = sh.add_worksheet(title=TEMP_EDIT_SHEET_NAME, rows=1000, cols=5)
+    ws = _get_ws(TEMP_EDIT_SHEET_NAME, create=True, rows=1000, cols=5)
 
-    values = ws.get_all_values()
+    current = _header_row(ws)
     headers = ["Name", "Date", "Time", "Activity", "submission batch id"]
-    if not values:
+    if not current:
         ws.append_row(headers, value_input_option="USER_ENTERED")
+        _invalidate_headers(ws, headers)
         return ws
 
-    current = list(values[0])
     changed = False
     for i, h in enumerate(headers):
         if i >= len(current) or str(current[i]).strip() != h:
@@ -199,8 +210,9 @@ def _ensure_temp_edit_sheet():
             current[i] = h
             changed = True
     if changed:
-        end_col = chr(ord("A") + len(current) - 1)
+        end_col = _col_letter(len(current) - 1)
         ws.update(f"A1:{end_col}1", [current], value_input_option="USER_ENTERED")
+        _invalidate_headers(ws, current)
     return ws
 
 
@@ -213,9 +225,7 @@ def _log_temp_edit_to_sheet(editor_name: str, submitted_date: str, submitted_tim
 
 
 def _update_account_in_sheet(old_row: dict, new_values: dict):
-    client = get_gs_client()
-    sh = client.open("District4 Data")
-    ws = sh.worksheet("Accounts")
+    ws = _get_ws("Accounts")
     headers = _ensure_accounts_headers(ws)
     payload = {
         "full_name": new_values.get("name", old_row.get("name", "")),
@@ -231,7 +241,7 @@ def _update_account_in_sheet(old_row: dict, new_values: dict):
         "google_pin_location": new_values.get("google_pin_location", old_row.get("google_pin_location", "")),
     }
     row_values = [_build_account_row_from_headers(headers, payload)]
-    end_col = chr(ord("A") + len(headers) - 1)
+    end_col = _col_letter(len(headers) - 1)
     ws.update(
         f"A{int(old_row['sheet_row'])}:{end_col}{int(old_row['sheet_row'])}",
         row_values,